@@ -30,7 +30,8 @@ addon_dir = os.path.dirname(__file__)
 if addon_dir not in sys.path:
     sys.path.append(addon_dir)
 
-from . import blender_materialx_exporter
+# The exporter (and MaterialX with its standard libraries) is imported lazily
+# by the operators so that enabling the addon and drawing the panel stay cheap.
 
 
 def print_startup_message():
@@ -267,6 +268,7 @@ class MATERIALX_OT_export_all(Operator):
         logger.info(f"Relative paths: {self.relative_paths}")
         
         # Export all materials
+        from . import blender_materialx_exporter
         results = blender_materialx_exporter.export_all_materials_to_materialx(
             self.directory, 
             logger,
@@ -20,47 +20,72 @@ Usage:
     mtlx_exporter.export_material_to_materialx(material, "output.mtlx")
 """
 
-import bpy
+from __future__ import annotations
+
 import os
 import shutil
+import sys
 import time
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
-import math
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Any
+
+# bpy is only needed at runtime for path resolution and scene access, so it
+# is imported where used; annotations refer to it through TYPE_CHECKING.
+if TYPE_CHECKING:
+    import bpy
 
 # Import the new MaterialX library core
 try:
     from . import materialx_library_core
-    from .materialx_library_core import MaterialXLibraryBuilder, MaterialXDocumentManager, MaterialXTypeConverter
+    from .materialx_library_core import MaterialXLibraryBuilder
     print("MaterialX library core imported successfully")
 except ImportError as e:
     print(f"Failed to import MaterialX library core: {e}")
     # Fallback for direct import
     import materialx_library_core
-    from materialx_library_core import MaterialXLibraryBuilder, MaterialXDocumentManager, MaterialXTypeConverter
+    from materialx_library_core import MaterialXLibraryBuilder
     print("MaterialX library core imported via fallback")
 
 
+# Type names of Blender/mathutils array values, detected by name so that the
+# check needs neither a bpy/mathutils import nor a per-value attribute probe
+_BLENDER_ARRAY_TYPE_NAMES = frozenset({'bpy_prop_array', 'Vector', 'Color', 'Euler', 'Quaternion'})
+
+
 def get_input_value_or_connection(node, input_name, exported_nodes=None) -> Tuple[bool, Any, str]:
     """
     Centralized utility to get input value or connection for a Blender node.
     Returns (is_connected, value_or_node_name, type_str)
     If connected, value_or_node_name is the MaterialX node name (from exported_nodes), not Blender node name.
     """
-    if not hasattr(node, 'inputs'):
+    inputs = getattr(node, 'inputs', None)
+    if inputs is None:
         raise AttributeError(f"Node {node} has no 'inputs' attribute")
-    if input_name not in node.inputs:
+    # Single collection lookup instead of a membership test plus indexing
+    input_socket = inputs.get(input_name)
+    if input_socket is None:
         raise KeyError(f"Input '{input_name}' not found in node {node.name}")
-    input_socket = node.inputs[input_name]
+    return get_socket_value_or_connection(input_socket, exported_nodes)
+
+
+def get_socket_value_or_connection(input_socket, exported_nodes=None) -> Tuple[bool, Any, str]:
+    """
+    Same as get_input_value_or_connection, for an already resolved input socket.
+    """
     if input_socket.is_linked and input_socket.links:
         from_node = input_socket.links[0].from_node
-        if exported_nodes is not None and from_node in exported_nodes:
-            return True, exported_nodes[from_node], str(input_socket.type)
+        exported_name = exported_nodes.get(from_node) if exported_nodes is not None else None
+        if exported_name is not None:
+            return True, exported_name, str(input_socket.type)
         else:
             return True, from_node.name, str(input_socket.type)
     else:
         value = getattr(input_socket, 'default_value', None)
+        # Snapshot Blender arrays once here, so the mappers and the value
+        # conversion downstream only ever see plain (hashable) tuples
+        if type(value).__name__ in _BLENDER_ARRAY_TYPE_NAMES:
+            value = tuple(value)
         return False, value, str(input_socket.type)
 
 
@@ -78,6 +103,11 @@ def get_node_output_name_robust(blender_node_type: str, blender_output_name: str
     Raises:
         ValueError: If no explicit mapping is found
     """
+    mtlx_output_name = _NODE_OUTPUT_NAMES.get((blender_node_type, blender_output_name))
+    if mtlx_output_name is not None:
+        return mtlx_output_name
+    
+    # Slow path: only reached to build a descriptive error
     if blender_node_type in NODE_MAPPING:
         node_mapping = NODE_MAPPING[blender_node_type]
         if 'outputs' in node_mapping:
@@ -106,6 +136,11 @@ def get_node_input_name_robust(blender_node_type: str, blender_input_name: str)
     Raises:
         ValueError: If no explicit mapping is found
     """
+    mtlx_input_name = _NODE_INPUT_NAMES.get((blender_node_type, blender_input_name))
+    if mtlx_input_name is not None:
+        return mtlx_input_name
+    
+    # Slow path: only reached to build a descriptive error
     if blender_node_type in NODE_MAPPING:
         node_mapping = NODE_MAPPING[blender_node_type]
         if 'inputs' in node_mapping:
@@ -133,9 +168,9 @@ def get_node_mtlx_type(blender_node_type: str) -> Tuple[str, str]:
     Raises:
         ValueError: If no explicit mapping is found
     """
-    if blender_node_type in NODE_MAPPING:
-        node_mapping = NODE_MAPPING[blender_node_type]
-        return node_mapping['mtlx_type'], node_mapping['mtlx_category']
+    mtlx_types = _NODE_MTLX_TYPES.get(blender_node_type)
+    if mtlx_types is not None:
+        return mtlx_types
     else:
         raise ValueError(f"No explicit mapping found for node type '{blender_node_type}'. Available node types: {list(NODE_MAPPING.keys())}")
 
@@ -692,34 +727,408 @@ NODE_MAPPING = {
     },
 }
 
+# Default values for essential standard surface parameters, used when a
+# Principled BSDF input has no value. Shared by every export, so vector
+# defaults are tuples.
+STANDARD_SURFACE_DEFAULTS = {
+    'base': 1.0,
+    'specular': 1.0,
+    'specular_color': (1.0, 1.0, 1.0),
+    'specular_roughness': 0.5,
+    'specular_IOR': 1.5,
+    'metalness': 0.0,
+    'transmission': 0.0,
+    'transmission_color': (1.0, 1.0, 1.0),
+    'transmission_depth': 0.0,
+    'transmission_scatter': (0.0, 0.0, 0.0),
+    'transmission_scatter_anisotropy': 0.0,
+    'transmission_dispersion': 0.0,
+    'transmission_extra_roughness': 0.0,
+    'opacity': (1.0, 1.0, 1.0),
+    'emission': 0.0,
+    'emission_color': (1.0, 1.0, 1.0),
+    'subsurface': 0.0,
+    'subsurface_color': (1.0, 1.0, 1.0),
+    'subsurface_radius': (1.0, 0.2, 0.1),
+    'subsurface_scale': 0.05,
+    'subsurface_anisotropy': 0.0,
+    'sheen': 0.0,
+    'sheen_color': (1.0, 1.0, 1.0),
+    'sheen_tint': 1.0,
+    'sheen_roughness': 0.5,
+    'coat': 0.0,
+    'coat_color': (1.0, 1.0, 1.0),
+    'coat_roughness': 0.1,
+    'coat_IOR': 1.5,
+    'anisotropic': 0.0,
+    'anisotropic_rotation': 0.0,
+    'anisotropic_direction': (0.0, 1.0, 0.0),
+}
+
+# Fallback for standard surface inputs missing from STANDARD_SURFACE_DEFAULTS
+_STANDARD_SURFACE_TYPE_DEFAULTS = {
+    'float': 0.0,
+    'color3': (1.0, 1.0, 1.0),
+    'vector3': (0.0, 0.0, 0.0),
+}
+
+def _normalize_float_value(value, default):
+    """Use the first component of a vector/color, or default if there is no value."""
+    if isinstance(value, (list, tuple)) and len(value) > 0:
+        value = value[0]
+    return default if value is None else value
+
+
+def _normalize_triple_value(value, default):
+    """Trim or zero-pad a vector/color to 3 components, or default if there is no value."""
+    if isinstance(value, (list, tuple)):
+        if len(value) >= 3:
+            value = value[:3]
+        else:
+            value = list(value) + [0.0] * (3 - len(value))
+    return default if value is None else value
+
+
+# Principled BSDF constant input normalization by MaterialX type
+PRINCIPLED_VALUE_NORMALIZERS = {
+    'float': _normalize_float_value,
+    'color3': _normalize_triple_value,
+    'vector3': _normalize_triple_value,
+}
+
+# Principled BSDF schema unpacked once into (blender input, mtlx input, type,
+# category, default, normalizer) rows, so the mapper does not re-read four
+# dict keys and resolve the default and value normalizer per input.
+PRINCIPLED_BSDF_INPUTS = tuple(
+    (entry['blender'], entry['mtlx'], entry['type'], entry.get('category', 'surfaceshader'),
+     STANDARD_SURFACE_DEFAULTS.get(entry['mtlx'], _STANDARD_SURFACE_TYPE_DEFAULTS.get(entry['type'])),
+     PRINCIPLED_VALUE_NORMALIZERS.get(entry['type']))
+    for entry in NODE_SCHEMAS['PRINCIPLED_BSDF']
+)
+
+# Standard surface inputs that are only written when connected; their
+# unconnected Blender values are not meaningful MaterialX constants
+CONNECTION_ONLY_SURFACE_INPUTS = frozenset({'normal', 'tangent'})
+
+# Standard surface lobe weights and the inputs that only have an effect while
+# that weight is non-zero
+STANDARD_SURFACE_LOBES = {
+    'transmission': ('transmission_color', 'transmission_depth', 'transmission_scatter',
+                     'transmission_scatter_anisotropy', 'transmission_dispersion',
+                     'transmission_extra_roughness'),
+    'emission': ('emission_color',),
+    'subsurface': ('subsurface_color', 'subsurface_radius', 'subsurface_scale', 'subsurface_anisotropy'),
+    'sheen': ('sheen_color', 'sheen_tint', 'sheen_roughness'),
+    'coat': ('coat_color', 'coat_roughness', 'coat_IOR', 'coat_normal'),
+    'anisotropic': ('anisotropic_rotation', 'anisotropic_direction'),
+}
+
+# Principled BSDF sockets holding each lobe weight: the Blender 4.0+ name
+# first, then the pre-4.0 name
+PRINCIPLED_LOBE_WEIGHT_SOCKETS = {
+    'transmission': ('Transmission Weight', 'Transmission'),
+    'emission': ('Emission Strength',),
+    'subsurface': ('Subsurface Weight', 'Subsurface'),
+    'sheen': ('Sheen Weight', 'Sheen'),
+    'coat': ('Coat Weight', 'Coat'),
+    'anisotropic': ('Anisotropic',),
+}
+
+# (Blender weight socket names, MaterialX inputs pruned when it is zero) rows
+PRINCIPLED_LOBE_WEIGHTS = tuple(
+    (PRINCIPLED_LOBE_WEIGHT_SOCKETS[mtlx_param], frozenset(lobe_params))
+    for mtlx_param, lobe_params in STANDARD_SURFACE_LOBES.items()
+)
+
+# Flattened (blender node type, blender socket name) -> MaterialX name lookups,
+# built once from NODE_MAPPING so the robust name helpers resolve a name with
+# a single dict probe.
+_NODE_INPUT_NAMES = {
+    (blender_node_type, blender_name): mtlx_name
+    for blender_node_type, node_mapping in NODE_MAPPING.items()
+    for blender_name, mtlx_name in node_mapping.get('inputs', {}).items()
+}
+_NODE_OUTPUT_NAMES = {
+    (blender_node_type, blender_name): mtlx_name
+    for blender_node_type, node_mapping in NODE_MAPPING.items()
+    for blender_name, mtlx_name in node_mapping.get('outputs', {}).items()
+}
+# Blender node type -> (MaterialX node type, MaterialX category), precomputed so
+# get_node_mtlx_type returns the pair from one probe.
+_NODE_MTLX_TYPES = {
+    blender_node_type: (node_mapping['mtlx_type'], node_mapping['mtlx_category'])
+    for blender_node_type, node_mapping in NODE_MAPPING.items()
+}
+
+
+# Blender Math / Vector Math operation -> MaterialX node type, built once
+# instead of on every mapped node.
+MATH_OPERATION_MAP = {
+    'add': 'add',
+    'subtract': 'subtract',
+    'multiply': 'multiply',
+    'divide': 'divide',
+    'power': 'power',
+    'logarithm': 'log',
+    'sqrt': 'sqrt',
+    'inverse_sqrt': 'inversesqrt',
+    'absolute': 'absval',
+    'exponent': 'exp',
+    'minimum': 'min',
+    'maximum': 'max',
+    'greater_than': 'ifgreater',
+    'less_than': 'ifgreater',
+    'sign': 'sign',
+    'compare': 'compare',
+    'smoothstep': 'smoothstep',
+    'step': 'step',
+    'round': 'round',
+    'floor': 'floor',
+    'ceil': 'ceil',
+    'trunc': 'trunc',
+    'fract': 'fract',
+    'modulo': 'modulo',
+    'wrap': 'wrap',
+    'snap': 'snap',
+    'pingpong': 'pingpong',
+    'sine': 'sin',
+    'cosine': 'cos',
+    'tangent': 'tan',
+    'arcsine': 'asin',
+    'arccosine': 'acos',
+    'arctangent': 'atan',
+    'arctan2': 'atan2',
+    'hyperbolic_sine': 'sinh',
+    'hyperbolic_cosine': 'cosh',
+    'hyperbolic_tangent': 'tanh',
+    'to_radians': 'radians',
+    'to_degrees': 'degrees',
+    'clamp': 'clamp',
+    'mix': 'mix',
+    'smooth_min': 'smoothmin',
+    'smooth_max': 'smoothmax',
+}
+
+VECTOR_MATH_OPERATION_MAP = {
+    'add': 'add',
+    'subtract': 'subtract',
+    'multiply': 'multiply',
+    'divide': 'divide',
+    'cross_product': 'crossproduct',
+    'project': 'project',
+    'reflect': 'reflect',
+    'refract': 'refract',
+    'faceforward': 'faceforward',
+    'dot_product': 'dotproduct',
+    'distance': 'distance',
+    'length': 'length',
+    'normalize': 'normalize',
+    'absolute': 'absval',
+    'minimum': 'min',
+    'maximum': 'max',
+    'floor': 'floor',
+    'ceil': 'ceil',
+    'fraction': 'fraction',
+    'modulo': 'modulo',
+    'wrap': 'wrap',
+    'snap': 'snap',
+    'sin': 'sin',
+    'cos': 'cos',
+    'tan': 'tan',
+    'asin': 'asin',
+    'acos': 'acos',
+    'atan': 'atan',
+    'atan2': 'atan2',
+    'sinh': 'sinh',
+    'cosh': 'cosh',
+    'tanh': 'tanh',
+    'log': 'ln',
+    'logarithm': 'log',
+    'sqrt': 'sqrt',
+    'inverse_sqrt': 'inversesqrt',
+    'exponent': 'exp',
+    'to_radians': 'radians',
+    'to_degrees': 'degrees',
+    'sign': 'sign',
+    'compare': 'compare',
+    'smoothstep': 'smoothstep',
+    'step': 'step',
+    'round': 'round',
+    'trunc': 'trunc',
+    'fract': 'fract',
+    'clamp': 'clamp',
+    'mix': 'mix',
+    'pingpong': 'pingpong',
+    'smooth_min': 'smoothmin',
+    'smooth_max': 'smoothmax',
+}
+
+# Shader node types that are reported as unsupported, and the individual BSDFs
+# that a Principled BSDF replaces (used for export guidance)
+UNSUPPORTED_SHADER_NODE_TYPES = frozenset({'EMISSION', 'FRESNEL'})
+SEPARATE_BSDF_NODE_TYPES = frozenset({'BSDF_DIFFUSE', 'BSDF_GLOSSY', 'BSDF_GLASS'})
+
+# Export log guidance for unsupported node types, by Blender node type
+# (message templates are formatted with the node's name and type)
+UNSUPPORTED_NODE_GUIDANCE = {
+    'EMISSION': (
+        "  ✗ Emission shader '{name}' is not supported.",
+        "  💡 Suggestion: Replace with Principled BSDF and use 'Emission Color' and 'Emission Strength' inputs instead.",
+        "  💡 This addon only supports materials that use Principled BSDF nodes.",
+    ),
+    'FRESNEL': (
+        "  ✗ Fresnel node '{name}' is not supported.",
+        "  💡 Suggestion: Remove this node and use Principled BSDF's built-in fresnel effects via 'Specular IOR Level' and 'IOR' inputs.",
+        "  💡 Principled BSDF has built-in fresnel calculations that are more accurate and efficient.",
+    ),
+}
+GENERIC_UNSUPPORTED_NODE_GUIDANCE = (
+    "  ✗ Node type '{type}' ({name}) is not supported.",
+    "  💡 Suggestion: Use only supported node types or replace with equivalent Principled BSDF functionality.",
+)
+
+# Default output names for multi-output MaterialX nodes, used when the node
+# definition lookup fails (everything else falls back to 'out')
+FALLBACK_OUTPUT_NAMES = {
+    'separate3': 'outr',  # separate3 has outr, outg, outb
+    'split3': 'out1',     # split3 has out1, out2, out3
+    'split2': 'out1',     # split2 has out1, out2
+}
+
+# Blender ColorRamp interpolation -> MaterialX ramp interpolation
+RAMP_INTERPOLATION_MAP = {
+    'LINEAR': 0,
+    'CONSTANT': 2,
+    'EASING': 1,
+    'CARDINAL': 1,
+    'B_SPLINE': 1
+}
+
+# (interval, color) input names of the MaterialX ramp's 10 control points,
+# interned once rather than formatted per control point
+RAMP_CONTROL_POINT_INPUTS = tuple(
+    (sys.intern(f'interval{i}'), sys.intern(f'color{i}')) for i in range(1, 11)
+)
+
+# Constant input values written by the mappers, shared as immutable tuples
+# instead of building a new list for every mapped node
+DEFAULT_NORMAL_MAP_VALUE = (0.5, 0.5, 1.0)  # Flat tangent-space normal
+ZERO_VECTOR3 = (0.0, 0.0, 0.0)
+UNKNOWN_NODE_COLOR = (1.0, 0.0, 1.0)  # Magenta for unknown nodes
+
 
 class ConstantManager:
     """Manages constant nodes to avoid duplication."""
     
+    __slots__ = ('constants', 'constant_names', 'constant_counter')
+    
     def __init__(self):
         self.constants = {}  # (value, type) -> node_name
+        self.constant_names = set()  # node names in self.constants
         self.constant_counter = 0
     
     def get_or_create_constant(self, builder, value, value_type):
         """Get existing constant node or create new one."""
         key = (value, value_type)
-        if key not in self.constants:
+        node_name = self.constants.get(key)
+        if node_name is None:
             node_name = f"constant_{self.constant_counter}"
             self.constant_counter += 1
             builder.add_node("constant", node_name, value_type, value=value)
             self.constants[key] = node_name
-        return self.constants[key]
+            self.constant_names.add(node_name)
+        return node_name
     
     def should_emit_constant(self, node_name):
         """Check if constant should be emitted (has connections)."""
-        return node_name in [name for name in self.constants.values()]
+        return node_name in self.constant_names
     
     def reset(self):
         """Reset for new material."""
         self.constants.clear()
+        self.constant_names.clear()
         self.constant_counter = 0
 
 
+def get_exported_source_node(builder, exported_nodes, node_name):
+    """
+    Find the Blender node that was exported as the given MaterialX node name.
+    
+    Uses the exporter's name index when available instead of scanning
+    exported_nodes, which is O(n) per connected input.
+    """
+    exporter = getattr(builder, 'exporter', None)
+    exported_nodes_by_name = getattr(exporter, 'exported_nodes_by_name', None)
+    if exported_nodes_by_name is not None:
+        return exported_nodes_by_name.get(node_name)
+    if exported_nodes:
+        for node_obj, node_name_in_exported in exported_nodes.items():
+            if node_name_in_exported == node_name:
+                return node_obj
+    return None
+
+
+def connect_mapped_input(node, builder, node_name, blender_input, source_name, exported_nodes=None,
+                         input_socket=None, mtlx_input_name=None):
+    """
+    Connect a linked Blender input to its MaterialX source using NODE_MAPPING.
+    
+    Args:
+        node: Blender node owning the input
+        builder: MaterialX builder
+        node_name: MaterialX node receiving the connection
+        blender_input: Blender input socket name
+        source_name: MaterialX name of the exported source node
+        exported_nodes: Dictionary of exported nodes
+        input_socket: The already resolved input socket, if the caller has it
+        mtlx_input_name: The already resolved MaterialX input name, if known
+    """
+    # Get the source node type and output name
+    output_name = 'out'  # Fallback to default output name
+    node_obj = get_exported_source_node(builder, exported_nodes, source_name)
+    if node_obj is not None:
+        # The input's own link already knows which output feeds it
+        if input_socket is None:
+            input_socket = node.inputs[blender_input]
+        source_output_name = input_socket.links[0].from_socket.name
+        if node_obj.type and source_output_name:
+            output_name = get_node_output_name_robust(node_obj.type, source_output_name)
+    
+    # Get the correct input name using robust mapping
+    correct_input_name = mtlx_input_name or get_node_input_name_robust(node.type, blender_input)
+    builder.logger.debug("Robust mapping - node type: %s, blender input: %s, correct input: %s",
+                         node.type, blender_input, correct_input_name)
+    
+    builder.add_connection(source_name, output_name, node_name, correct_input_name)
+
+
+# (schema id, node category, Blender node type, socket count) -> tuple of
+# (socket index, blender input, mtlx param, param type, param category,
+# mapped connection input name) rows. A Blender node type always has the
+# same sockets, so which schema entries it provides and where connections
+# to them land only need to be worked out once per type.
+_SCHEMA_SOCKET_PLANS = {}
+
+
+def _get_schema_socket_plan(node, inputs, schema, node_category):
+    """Return the cached schema/socket matching for this node's type."""
+    plan_key = (id(schema), node_category, node.bl_idname, len(inputs))
+    plan = _SCHEMA_SOCKET_PLANS.get(plan_key)
+    if plan is None:
+        # The first socket with a given name wins, as with inputs.get()
+        pending_entries = {entry['blender']: entry for entry in reversed(schema)}
+        rows = []
+        for index, input_socket in enumerate(inputs):
+            entry = pending_entries.pop(input_socket.name, None)
+            if entry is not None:
+                # None leaves unmapped inputs to the robust lookup's error
+                rows.append((index, entry['blender'], entry['mtlx'], entry['type'],
+                             entry.get('category', node_category),
+                             _NODE_INPUT_NAMES.get((node.type, entry['blender']))))
+        plan = _SCHEMA_SOCKET_PLANS[plan_key] = tuple(rows)
+    return plan
+
+
 def map_node_with_schema_enhanced(node, builder, schema, node_type, node_category, constant_manager=None, exported_nodes=None):
     """
     Enhanced node mapping using Phase 2 type-safe input creation.
@@ -739,53 +1148,30 @@ def map_node_with_schema_enhanced(node, builder, schema, node_type, node_categor
     # Create node with proper category
     node_name = builder.add_node(node_type, f"{node_type}_{node.name}", node_category)
     
-    # Map inputs using enhanced type-safe method
-    for entry in schema:
-        blender_input = entry['blender']
-        mtlx_param = entry['mtlx']
-        param_type = entry['type']
-        param_category = entry.get('category', node_category)
-        
+    inputs = getattr(node, 'inputs', None)
+    if not inputs:
+        return node_name
+    
+    # Resolve the builder attribute chains once for all inputs
+    create_input = builder.library_builder.node_builder.create_mtlx_input
+    mtlx_node = builder.nodes.get(node_name)
+    
+    # Map inputs using enhanced type-safe method, visiting only the sockets
+    # this node type is known to provide
+    for index, blender_input, mtlx_param, param_type, param_category, connect_input in _get_schema_socket_plan(
+            node, inputs, schema, node_category):
+        input_socket = inputs[index]
         try:
-            is_connected, value_or_node, type_str = get_input_value_or_connection(node, blender_input, exported_nodes)
+            is_connected, value_or_node, type_str = get_socket_value_or_connection(input_socket, exported_nodes)
             
             if is_connected:
                 # Connected input - use robust connection mapping
-                # Get the source node type and output name
-                source_node_type = None
-                source_output_name = None
-                if exported_nodes:
-                    # Find the source node by looking up the MaterialX node name
-                    for node_obj, node_name_in_exported in exported_nodes.items():
-                        if node_name_in_exported == value_or_node:
-                            source_node_type = node_obj.type
-                            # Get the output name from the source node's output socket
-                            for output_socket in node_obj.outputs:
-                                if output_socket.links:
-                                    for link in output_socket.links:
-                                        if link.to_node == node and link.to_socket.name == blender_input:
-                                            source_output_name = output_socket.name
-                                            break
-                                    if source_output_name:
-                                        break
-                            break
-                
-                # Get the correct output name using robust mapping
-                if source_node_type and source_output_name:
-                    output_name = get_node_output_name_robust(source_node_type, source_output_name)
-                else:
-                    # Fallback to default output name
-                    output_name = 'out'
-                
-                # Get the correct input name using robust mapping
-                correct_input_name = get_node_input_name_robust(node.type, blender_input)
-                print(f"DEBUG: Robust mapping - node type: {node.type}, blender input: {blender_input}, mtlx param: {mtlx_param}, correct input: {correct_input_name}")
-                
-                builder.add_connection(value_or_node, output_name, node_name, correct_input_name)
-            else:
+                connect_mapped_input(node, builder, node_name, blender_input, value_or_node, exported_nodes,
+                                     input_socket, connect_input)
+            elif mtlx_node is not None:
                 # Constant input - use type-safe input creation
-                builder.library_builder.node_builder.create_mtlx_input(
-                    builder.nodes[node_name], mtlx_param, 
+                create_input(
+                    mtlx_node, mtlx_param, 
                     value=value_or_node,
                     node_type=node_type, category=param_category
                 )
@@ -796,6 +1182,104 @@ def map_node_with_schema_enhanced(node, builder, schema, node_type, node_categor
     return node_name
 
 
+def make_schema_mapper(schema_key, node_type, node_category, label):
+    """
+    Build a NodeMapper function for a node that is mapped purely from its schema.
+    
+    The schema and MaterialX type are bound once here, instead of every
+    mapper re-resolving NODE_SCHEMAS[...] on each call.
+    """
+    schema = NODE_SCHEMAS[schema_key]
+    
+    def mapper(node, builder, input_nodes, input_nodes_by_index=None, blender_node=None, constant_manager=None, exported_nodes=None):
+        return map_node_with_schema_enhanced(node, builder, schema, node_type, node_category, constant_manager, exported_nodes)
+    
+    mapper.__doc__ = f"Enhanced {label} mapping with type-safe input creation."
+    return mapper
+
+
+def make_node_only_mapper(node_type, name_prefix, node_category, label):
+    """
+    Build a NodeMapper function for a node that maps to a bare MaterialX node.
+    
+    No inputs are mapped; the node is only created, named
+    '<name_prefix>_<Blender node name>'.
+    """
+    def mapper(node, builder, input_nodes, input_nodes_by_index=None, blender_node=None, constant_manager=None, exported_nodes=None):
+        return builder.add_node(node_type, f"{name_prefix}_{node.name}", node_category)
+    
+    mapper.__doc__ = f"Map {label} node to MaterialX {node_type} node."
+    return mapper
+
+
+# Blender node type of a connection source -> MaterialX node type whose
+# default output the math mappers connect from (anything else: 'constant')
+SOURCE_NODE_MTLX_TYPES = {
+    'TEX_COORD': 'texcoord',
+    'RGB': 'constant',
+    'VALUE': 'constant',
+    'MIX': 'mix',
+    'INVERT': 'invert',
+    'SEPARATE_COLOR': 'separate3',
+    'COMBINE_COLOR': 'combine3',
+    'CHECKER_TEXTURE': 'checkerboard',
+    'GRADIENT_TEXTURE': 'ramplr',
+    'NOISE_TEXTURE': 'fractal3d',
+    'WAVE_TEXTURE': 'wave',
+    'NORMAL_MAP': 'normalmap',
+    'BUMP': 'bump',
+    'MAPPING': 'transform2d',
+    'LAYER_WEIGHT': 'layer',
+    'MATH': 'add',
+    'VECTOR_MATH': 'add',
+    'IMAGE_TEXTURE': 'image',
+    'BSDF_PRINCIPLED': 'standard_surface',
+}
+
+
+def _map_math_inputs(node, builder, node_name, schema_key, mtlx_operation, default_category,
+                     default_value, exported_nodes=None):
+    """
+    Map the inputs of a Math / Vector Math node onto its MaterialX node.
+    
+    Connected inputs are wired to the source node's default output; the
+    others get default_value. Shared by the math and vector math mappers.
+    """
+    schema = NODE_SCHEMAS.get(schema_key)
+    if not schema:
+        return
+    
+    # Resolve the builder attribute chains once for all inputs
+    create_input = builder.library_builder.node_builder.create_mtlx_input
+    mtlx_node = builder.nodes.get(node_name)
+    
+    inputs = getattr(node, 'inputs', None)
+    if not inputs:
+        return
+    
+    # Walk the sockets this node type provides, via the cached per-type plan,
+    # instead of looking every schema input up by name
+    for index, blender_input, mtlx_param, _, param_category, _ in _get_schema_socket_plan(
+            node, inputs, schema, default_category):
+        try:
+            is_connected, value_or_node, type_str = get_socket_value_or_connection(inputs[index], exported_nodes)
+            
+            if is_connected:
+                # Get the correct output name from the source node
+                source_node = get_exported_source_node(builder, exported_nodes, value_or_node)
+                source_node_type = source_node.type if source_node is not None else None
+                output_name = builder.get_source_output_name(source_node_type)
+                
+                builder.add_connection(value_or_node, output_name, node_name, mtlx_param)
+            elif mtlx_node is not None:
+                # Set default value using type-safe method
+                create_input(mtlx_node, mtlx_param, value=default_value,
+                             node_type=mtlx_operation, category=param_category)
+                
+        except (KeyError, AttributeError):
+            continue
+
+
 class MaterialXBuilder:
     """
     MaterialX document builder using Phase 2 enhanced functionality.
@@ -818,10 +1302,15 @@ class MaterialXBuilder:
         self.connections = self.library_builder.connections
         self.node_counter = self.library_builder.node_counter
         
-        self.logger.info(f"MaterialXBuilder: Library builder initialized, document has {len(self.document.getNodeDefs())} node definitions")
+        self.logger.info(f"MaterialXBuilder: Library builder initialized, libraries provide {len(self.library_builder.doc_manager.libraries.getNodeDefs())} node definitions")
         
-        # Phase 2 enhancements
-        self.type_converter = MaterialXTypeConverter(logger)
+        # Phase 2 enhancements - share the node builder's converter
+        self.type_converter = self.library_builder.node_builder.type_converter
+        
+        # Resolved output names keyed by (node_type, node_category)
+        self._output_name_cache = {}
+        # Default output names keyed by connection source Blender node type
+        self._source_output_name_cache = {}
         
     def add_node(self, node_type: str, name: str, node_type_category: str = None, **params) -> str:
         """Add a node using enhanced type-safe creation."""
@@ -851,9 +1340,9 @@ class MaterialXBuilder:
         """Convert to string using enhanced library methods."""
         return self.library_builder.to_string()
     
-    def write_to_file(self, filepath: str) -> bool:
+    def write_to_file(self, filepath: str, validate: bool = True) -> bool:
         """Write to file using enhanced library methods."""
-        return self.library_builder.write_to_file(filepath)
+        return self.library_builder.write_to_file(filepath, validate)
     
     def validate(self) -> bool:
         """Validate document using enhanced validation."""
@@ -861,25 +1350,19 @@ class MaterialXBuilder:
     
     def set_write_options(self, **options):
         """Set write options for the library builder."""
-        if hasattr(self.library_builder, 'set_write_options'):
-            self.library_builder.set_write_options(**options)
+        self.library_builder.set_write_options(**options)
     
     def cleanup(self):
         """Clean up resources."""
-        if hasattr(self.library_builder, 'cleanup'):
-            self.library_builder.cleanup()
+        self.library_builder.cleanup()
     
     def optimize_document(self) -> bool:
         """Optimize the document using enhanced library methods."""
-        if hasattr(self.library_builder, 'optimize_document'):
-            return self.library_builder.optimize_document()
-        return True  # Default to success if not available
+        return self.library_builder.optimize_document()
     
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get performance statistics from the library builder."""
-        if hasattr(self.library_builder, 'get_performance_stats'):
-            return self.library_builder.get_performance_stats()
-        return {}  # Default to empty dict if not available
+        return self.library_builder.get_performance_stats()
     
     def get_node_output_name(self, node_type: str, node_category: str = None) -> str:
         """
@@ -892,9 +1375,30 @@ class MaterialXBuilder:
         Returns:
             str: The default output name for the node type
         """
+        cache_key = (node_type, node_category)
+        output_name = self._output_name_cache.get(cache_key)
+        if output_name is None:
+            output_name = self._output_name_cache[cache_key] = self._lookup_node_output_name(node_type, node_category)
+        return output_name
+    
+    def get_source_output_name(self, source_node_type: Optional[str]) -> str:
+        """
+        Get the default MaterialX output name for a connection source Blender node type.
+        
+        Folds the SOURCE_NODE_MTLX_TYPES lookup and the output name lookup into
+        a single probe per source type.
+        """
+        output_name = self._source_output_name_cache.get(source_node_type)
+        if output_name is None:
+            mtlx_source_type = SOURCE_NODE_MTLX_TYPES.get(source_node_type, 'constant')
+            output_name = self._source_output_name_cache[source_node_type] = self.get_node_output_name(mtlx_source_type)
+        return output_name
+    
+    def _lookup_node_output_name(self, node_type: str, node_category: str = None) -> str:
+        """Resolve the default output name for a node type, uncached."""
         try:
             # Get the node definition from the MaterialX library
-            node_def = self.library_builder.document_manager.get_node_definition(node_type, node_category)
+            node_def = self.library_builder.doc_manager.get_node_definition(node_type, node_category)
             
             if node_def:
                 # Get all outputs from the node definition
@@ -904,7 +1408,7 @@ class MaterialXBuilder:
                     # Return the first output name (most nodes have a single output)
                     first_output = outputs[0]
                     output_name = first_output.getName()
-                    self.logger.debug(f"Found output '{output_name}' for node type '{node_type}'")
+                    self.logger.debug("Found output '%s' for node type '%s'", output_name, node_type)
                     return output_name
                 else:
                     self.logger.warning(f"No outputs found for node type '{node_type}'")
@@ -915,75 +1419,18 @@ class MaterialXBuilder:
             self.logger.error(f"Error getting output name for node type '{node_type}': {str(e)}")
         
         # Fallback to common output names if lookup fails
-        fallback_names = {
-            'separate3': 'outr',  # separate3 has outr, outg, outb
-            'split3': 'out1',     # split3 has out1, out2, out3
-            'split2': 'out1',     # split2 has out1, out2
-        }
-        
-        return fallback_names.get(node_type, 'out')
+        return FALLBACK_OUTPUT_NAMES.get(node_type, 'out')
 
 
 class NodeMapper:
     """Enhanced node mapper using Phase 2 type-safe functionality."""
     
+    __slots__ = ()
+    
     @staticmethod
     def get_node_mapper(node_type: str):
         """Get the appropriate mapper for a node type."""
-        mappers = {
-            'BSDF_PRINCIPLED': NodeMapper.map_principled_bsdf_enhanced,
-            'TEX_IMAGE': NodeMapper.map_image_texture_enhanced,
-            'TEX_COORD': NodeMapper.map_tex_coord,
-            'RGB': NodeMapper.map_rgb,
-            'VALUE': NodeMapper.map_value,
-            'NORMAL_MAP': NodeMapper.map_normal_map,
-            'VECTOR_MATH': NodeMapper.map_vector_math_enhanced,
-            'VECT_MATH': NodeMapper.map_vector_math_enhanced,  # Alias for Vector Math
-            'MATH': NodeMapper.map_math_enhanced,
-            'MIX': NodeMapper.map_mix_enhanced,
-            'MIX_RGB': NodeMapper.map_mix_enhanced,  # Alias for MixRGB
-            'MIX_RGB_LEGACY': NodeMapper.map_mix_enhanced,  # Alias for legacy Mix
-            'INVERT': NodeMapper.map_invert_enhanced,
-            'SEPARATE_COLOR': NodeMapper.map_separate_color_enhanced,
-            'COMBINE_COLOR': NodeMapper.map_combine_color_enhanced,
-            'BUMP': NodeMapper.map_bump,
-            'TEX_CHECKER': NodeMapper.map_checker_texture_enhanced,
-            'TEX_GRADIENT': NodeMapper.map_gradient_texture_enhanced,
-            'TEX_NOISE': NodeMapper.map_noise_texture_enhanced,
-            'TEX_VORONOI': NodeMapper.map_voronoi_texture_enhanced,
-            'CURVE_RGB': NodeMapper.map_curve_rgb_enhanced,
-            'CLAMP': NodeMapper.map_clamp_enhanced,
-            'MAP_RANGE': NodeMapper.map_map_range_enhanced,
-            'MAPPING': NodeMapper.map_mapping,
-            'LAYER': NodeMapper.map_layer,
-            'ADD': NodeMapper.map_add,
-            'MULTIPLY': NodeMapper.map_multiply,
-            'ROUGHNESS_ANISOTROPY': NodeMapper.map_roughness_anisotropy,
-            'ARTISTIC_IOR': NodeMapper.map_artistic_ior,
-            'COLORRAMP': NodeMapper.map_color_ramp,  # New
-            'VALTORGB': NodeMapper.map_color_ramp,   # Alias for ColorRamp
-            'WAVE': NodeMapper.map_wave_texture_enhanced,     # New
-            'WAVE_TEXTURE': NodeMapper.map_wave_texture_enhanced, # Alias
-            'TEX_WAVE': NodeMapper.map_wave_texture_enhanced,     # Alias for Wave Texture
-            # New color and split/merge nodes:
-            'HSV_TO_RGB': NodeMapper.map_hsvtorgb,
-            'RGB_TO_HSV': NodeMapper.map_rgbtohsv,
-            'LUMINANCE': NodeMapper.map_luminance,
-            'BRIGHT_CONTRAST': NodeMapper.map_contrast,
-            'HUE_SAT': NodeMapper.map_saturate,
-            'GAMMA': NodeMapper.map_gamma,
-            'SEPARATE_RGB': NodeMapper.map_split_color,
-            'COMBINE_RGB': NodeMapper.map_merge_color,
-            'SEPARATE_XYZ': NodeMapper.map_split_vector,
-            'COMBINE_XYZ': NodeMapper.map_merge_vector,
-
-            'TEX_MUSGRAVE': NodeMapper.map_musgrave_texture_enhanced,
-            # New utility nodes
-            'NEW_GEOMETRY': NodeMapper.map_geometry_info_enhanced,
-            'OBJECT_INFO': NodeMapper.map_object_info_enhanced,
-            'LIGHT_PATH': NodeMapper.map_light_path_enhanced,
-        }
-        return mappers.get(node_type)
+        return NODE_MAPPERS.get(node_type)
     
     @staticmethod
     def map_principled_bsdf_enhanced(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
@@ -991,100 +1438,61 @@ class NodeMapper:
         # Create surface shader node
         node_name = builder.add_surface_shader_node("standard_surface", f"surface_{node.name}")
         
-        # Default values for essential standard surface parameters
-        default_values = {
-            'base': 1.0,
-            'specular': 1.0,
-            'specular_color': [1.0, 1.0, 1.0],
-            'specular_roughness': 0.5,
-            'specular_IOR': 1.5,
-            'metalness': 0.0,
-            'transmission': 0.0,
-            'transmission_color': [1.0, 1.0, 1.0],
-            'transmission_depth': 0.0,
-            'transmission_scatter': [0.0, 0.0, 0.0],
-            'transmission_scatter_anisotropy': 0.0,
-            'transmission_dispersion': 0.0,
-            'transmission_extra_roughness': 0.0,
-            'opacity': [1.0, 1.0, 1.0],
-            'emission': 0.0,
-            'emission_color': [1.0, 1.0, 1.0],
-            'subsurface': 0.0,
-            'subsurface_color': [1.0, 1.0, 1.0],
-            'subsurface_radius': [1.0, 0.2, 0.1],
-            'subsurface_scale': 0.05,
-            'subsurface_anisotropy': 0.0,
-            'sheen': 0.0,
-            'sheen_color': [1.0, 1.0, 1.0],
-            'sheen_tint': 1.0,
-            'sheen_roughness': 0.5,
-            'coat': 0.0,
-            'coat_color': [1.0, 1.0, 1.0],
-            'coat_roughness': 0.1,
-            'coat_IOR': 1.5,
-            'anisotropic': 0.0,
-            'anisotropic_rotation': 0.0,
-            'anisotropic_direction': [0.0, 1.0, 0.0],
-        }
+        # Resolved once for the whole input table instead of per input
+        create_input = builder.library_builder.node_builder.create_mtlx_input
+        surface_node = builder.nodes.get(node_name)
+        
+        # Snapshot the sockets in one pass over node.inputs instead of one
+        # RNA name lookup per row; the first socket with a name wins, as
+        # with inputs.get()
+        sockets = {}
+        for input_socket in getattr(node, 'inputs', ()):
+            sockets.setdefault(input_socket.name, input_socket)
+        
+        # Lobe pruning: constant inputs of a lobe whose weight is an
+        # unconnected zero have no effect, so they are not emitted (the
+        # weight itself still is)
+        pruned_params = set()
+        for weight_inputs, lobe_params in PRINCIPLED_LOBE_WEIGHTS:
+            # The first weight socket name present on this Blender version
+            weight_socket = next(
+                (sockets[name] for name in weight_inputs if name in sockets), None)
+            if (weight_socket is not None and not weight_socket.is_linked
+                    and getattr(weight_socket, 'default_value', None) == 0.0):
+                pruned_params |= lobe_params
         
         # Map inputs using enhanced schema with type information
-        for entry in NODE_SCHEMAS['PRINCIPLED_BSDF']:
-            blender_input = entry['blender']
-            mtlx_param = entry['mtlx']
-            param_type = entry['type']
-            param_category = entry.get('category', 'surfaceshader')
-            
+        for blender_input, mtlx_param, param_type, param_category, default_value, normalize in PRINCIPLED_BSDF_INPUTS:
+            input_socket = sockets.get(blender_input)
+            if input_socket is None:
+                continue  # Input not present on this Blender version, skip
             try:
-                is_connected, value_or_node, type_str = get_input_value_or_connection(node, blender_input, exported_nodes)
+                is_connected, value_or_node, type_str = get_socket_value_or_connection(input_socket, exported_nodes)
                 
                 # Special case: skip unconnected normal/tangent inputs for standard_surface
-                if mtlx_param in ("normal", "tangent") and not is_connected:
+                if not is_connected and mtlx_param in CONNECTION_ONLY_SURFACE_INPUTS:
                     continue
                 
                 if is_connected:
-                    # Connected input - add to nodegraph output and connect
-                    builder.add_output(mtlx_param, param_type, value_or_node)
+                    # Connected input - add_surface_shader_input creates the
+                    # nodegraph output for the source node and connects to it
                     builder.add_surface_shader_input(
                         node_name, mtlx_param, param_type, 
-                        nodegraph_name=builder.material_name
+                        nodegraph_name=builder.material_name,
+                        nodename=value_or_node
                     )
-                else:
+                elif surface_node is not None and mtlx_param not in pruned_params:
                     # Constant input - use type-safe input creation
-                    # Handle different value types properly
-                    if param_type == 'float':
-                        # For float inputs, extract the first component if it's a vector/color
-                        if isinstance(value_or_node, (list, tuple)) and len(value_or_node) > 0:
-                            value_or_node = value_or_node[0]
-                        # Use default if no value provided
-                        if value_or_node is None:
-                            value_or_node = default_values.get(mtlx_param, 0.0)
-                    elif param_type == 'color3':
-                        # For color3 inputs, ensure we have 3 components
-                        if isinstance(value_or_node, (list, tuple)):
-                            if len(value_or_node) >= 3:
-                                value_or_node = value_or_node[:3]
-                            else:
-                                # Pad with zeros if not enough components
-                                value_or_node = list(value_or_node) + [0.0] * (3 - len(value_or_node))
-                        # Use default if no value provided
-                        if value_or_node is None:
-                            value_or_node = default_values.get(mtlx_param, [1.0, 1.0, 1.0])
-                    elif param_type == 'vector3':
-                        # For vector3 inputs, ensure we have 3 components
-                        if isinstance(value_or_node, (list, tuple)):
-                            if len(value_or_node) >= 3:
-                                value_or_node = value_or_node[:3]
-                            else:
-                                # Pad with zeros if not enough components
-                                value_or_node = list(value_or_node) + [0.0] * (3 - len(value_or_node))
-                        # Use default if no value provided
-                        if value_or_node is None:
-                            value_or_node = default_values.get(mtlx_param, [0.0, 0.0, 0.0])
+                    if normalize is not None:
+                        value_or_node = normalize(value_or_node, default_value)
                     
-                    builder.library_builder.node_builder.create_mtlx_input(
-                        builder.nodes[node_name], mtlx_param, 
+                    # Values equal to the standard_surface nodedef default are
+                    # inherited from the nodedef, so no input is written
+                    create_input(
+                        surface_node, mtlx_param,
                         value=value_or_node,
-                        node_type='standard_surface', category=param_category
+                        node_type='standard_surface', category=param_category,
+                        skip_default=True
                     )
                     
             except (KeyError, AttributeError):
@@ -1099,13 +1507,14 @@ class NodeMapper:
         node_name = map_node_with_schema_enhanced(node, builder, NODE_SCHEMAS['IMAGE_TEXTURE'], 'image', 'color3', constant_manager, exported_nodes)
 
         # Custom logic for file/image handling
-        if node.image:
-            image_path = node.image.filepath
+        image = node.image
+        if image:
+            image_path = image.filepath
             if image_path:
+                # Exported textures are memoized by source path on the exporter
                 exporter = getattr(builder, 'exporter', None)
-                if exporter and image_path in exporter.texture_paths:
-                    rel_path = exporter.texture_paths[image_path]
-                else:
+                rel_path = exporter.texture_paths.get(image_path) if exporter else None
+                if rel_path is None:
                     rel_path = os.path.basename(image_path)
                 
                 # Use type-safe input creation for file input
@@ -1117,22 +1526,16 @@ class NodeMapper:
         
         return node_name
     
-    @staticmethod
-    def map_tex_coord(node, builder, input_nodes, input_nodes_by_index=None, blender_node=None, constant_manager=None, exported_nodes=None):
-        """Map Texture Coordinate node to MaterialX texcoord node."""
-        node_name = builder.add_node("texcoord", f"texcoord_{node.name}", "vector2")
-        return node_name
+    map_tex_coord = staticmethod(make_node_only_mapper('texcoord', 'texcoord', 'vector2', 'Texture Coordinate'))
     
     @staticmethod
     def map_rgb(node, builder, input_nodes, input_nodes_by_index=None, blender_node=None, constant_manager=None, exported_nodes=None):
         """Map RGB node to MaterialX constant node."""
-        # Get RGB values
-        r = getattr(node.outputs[0], 'default_value', [1, 1, 1, 1])[0]
-        g = getattr(node.outputs[0], 'default_value', [1, 1, 1, 1])[1]
-        b = getattr(node.outputs[0], 'default_value', [1, 1, 1, 1])[2]
+        # Get RGB values (one slice copy of the RGBA array)
+        rgb = list(getattr(node.outputs[0], 'default_value', (1, 1, 1, 1))[:3])
         
         # Create constant node with type-safe input creation
-        node_name = builder.add_node("constant", f"rgb_{node.name}", "color3", value=[r, g, b])
+        node_name = builder.add_node("constant", f"rgb_{node.name}", "color3", value=rgb)
         return node_name
     
     @staticmethod
@@ -1151,41 +1554,12 @@ class NodeMapper:
         try:
             is_connected, value_or_node, type_str = get_input_value_or_connection(node, 'Color', exported_nodes)
             if is_connected:
-                # Get the correct output name from the source node using robust mapping
-                source_node_type = None
-                source_output_name = None
-                if exported_nodes:
-                    for node_obj, node_name_in_exported in exported_nodes.items():
-                        if node_name_in_exported == value_or_node:
-                            source_node_type = node_obj.type
-                            # Get the output name from the source node's output socket
-                            for output_socket in node_obj.outputs:
-                                if output_socket.links:
-                                    for link in output_socket.links:
-                                        if link.to_node == node and link.to_socket.name == 'Color':
-                                            source_output_name = output_socket.name
-                                            break
-                                    if source_output_name:
-                                        break
-                            break
-                
-                # Get the correct output name using robust mapping
-                if source_node_type and source_output_name:
-                    output_name = get_node_output_name_robust(source_node_type, source_output_name)
-                else:
-                    # Fallback to default output name
-                    output_name = 'out'
-                
-                # Get the correct input name using robust mapping
-                correct_input_name = get_node_input_name_robust(node.type, 'Color')
-                print(f"DEBUG: Normal map robust mapping - node type: {node.type}, blender input: Color, correct input: {correct_input_name}")
-                
-                builder.add_connection(value_or_node, output_name, node_name, correct_input_name)
+                connect_mapped_input(node, builder, node_name, 'Color', value_or_node, exported_nodes)
             else:
                 # Set default normal value
                 builder.library_builder.node_builder.create_mtlx_input(
                     builder.nodes[node_name], 'in', 
-                    value=[0.5, 0.5, 1.0],
+                    value=DEFAULT_NORMAL_MAP_VALUE,
                     node_type='normalmap', category='vector3'
                 )
         except (KeyError, AttributeError):
@@ -1198,124 +1572,15 @@ class NodeMapper:
         """Enhanced vector math mapping with type-safe input creation."""
         # Map operation to MaterialX node type
         operation = node.operation.lower()
-        mtlx_operation_map = {
-            'add': 'add',
-            'subtract': 'subtract',
-            'multiply': 'multiply',
-            'divide': 'divide',
-            'cross_product': 'crossproduct',
-            'project': 'project',
-            'reflect': 'reflect',
-            'refract': 'refract',
-            'faceforward': 'faceforward',
-            'dot_product': 'dotproduct',
-            'distance': 'distance',
-            'length': 'length',
-            'normalize': 'normalize',
-            'absolute': 'absval',
-            'minimum': 'min',
-            'maximum': 'max',
-            'floor': 'floor',
-            'ceil': 'ceil',
-            'fraction': 'fraction',
-            'modulo': 'modulo',
-            'wrap': 'wrap',
-            'snap': 'snap',
-            'sin': 'sin',
-            'cos': 'cos',
-            'tan': 'tan',
-            'asin': 'asin',
-            'acos': 'acos',
-            'atan': 'atan',
-            'atan2': 'atan2',
-            'sinh': 'sinh',
-            'cosh': 'cosh',
-            'tanh': 'tanh',
-            'log': 'ln',
-            'logarithm': 'log',
-            'sqrt': 'sqrt',
-            'inverse_sqrt': 'inversesqrt',
-            'absolute': 'absval',
-            'exponent': 'exp',
-            'to_radians': 'radians',
-            'to_degrees': 'degrees',
-            'sign': 'sign',
-            'compare': 'compare',
-            'smoothstep': 'smoothstep',
-            'step': 'step',
-            'round': 'round',
-            'trunc': 'trunc',
-            'fract': 'fract',
-            'clamp': 'clamp',
-            'mix': 'mix',
-            'pingpong': 'pingpong',
-            'smooth_min': 'smoothmin',
-            'smooth_max': 'smoothmax',
-        }
         
-        mtlx_operation = mtlx_operation_map.get(operation, 'add')
+        mtlx_operation = VECTOR_MATH_OPERATION_MAP.get(operation, 'add')
         
         # Create node with enhanced type safety
         node_name = builder.add_node(mtlx_operation, f"{mtlx_operation}_{node.name}", "vector3")
         
         # Map inputs using enhanced schema
-        if 'VECTOR_MATH' in NODE_SCHEMAS:
-            for entry in NODE_SCHEMAS['VECTOR_MATH']:
-                blender_input = entry['blender']
-                mtlx_param = entry['mtlx']
-                param_type = entry['type']
-                param_category = entry.get('category', 'vector3')
-                
-                try:
-                    is_connected, value_or_node, type_str = get_input_value_or_connection(node, blender_input, exported_nodes)
-                    
-                    if is_connected:
-                        # Get the correct output name from the source node
-                        source_node_type = None
-                        if exported_nodes:
-                            for node_obj, node_name_in_exported in exported_nodes.items():
-                                if node_name_in_exported == value_or_node:
-                                    source_node_type = node_obj.type
-                                    break
-                        
-                        # Map Blender node type to MaterialX node type
-                        blender_to_mtlx_type = {
-                            'TEX_COORD': 'texcoord',
-                            'RGB': 'constant',
-                            'VALUE': 'constant',
-                            'MIX': 'mix',
-                            'INVERT': 'invert',
-                            'SEPARATE_COLOR': 'separate3',
-                            'COMBINE_COLOR': 'combine3',
-                            'CHECKER_TEXTURE': 'checkerboard',
-                            'GRADIENT_TEXTURE': 'ramplr',
-                            'NOISE_TEXTURE': 'fractal3d',
-                            'WAVE_TEXTURE': 'wave',
-                            'NORMAL_MAP': 'normalmap',
-                            'BUMP': 'bump',
-                            'MAPPING': 'transform2d',
-                            'LAYER_WEIGHT': 'layer',
-                            'MATH': 'add',
-                            'VECTOR_MATH': 'add',
-                            'IMAGE_TEXTURE': 'image',
-                            'BSDF_PRINCIPLED': 'standard_surface',
-                        }
-                        
-                        mtlx_source_type = blender_to_mtlx_type.get(source_node_type, 'constant')
-                        output_name = builder.get_node_output_name(mtlx_source_type)
-                        
-                        builder.add_connection(value_or_node, output_name, node_name, mtlx_param)
-                    else:
-                        # Set default value using type-safe method
-                        default_value = [0.0, 0.0, 0.0] if blender_input == 'A' else [0.0, 0.0, 0.0]
-                        builder.library_builder.node_builder.create_mtlx_input(
-                            builder.nodes[node_name], mtlx_param, 
-                            value=default_value,
-                            node_type=mtlx_operation, category=param_category
-                        )
-                        
-                except (KeyError, AttributeError):
-                    continue
+        _map_math_inputs(node, builder, node_name, 'VECTOR_MATH', mtlx_operation, 'vector3',
+                         ZERO_VECTOR3, exported_nodes)
         
         return node_name
     
@@ -1324,220 +1589,40 @@ class NodeMapper:
         """Enhanced math mapping with type-safe input creation."""
         # Map operation to MaterialX node type
         operation = node.operation.lower()
-        mtlx_operation_map = {
-            'add': 'add',
-            'subtract': 'subtract',
-            'multiply': 'multiply',
-            'divide': 'divide',
-            'power': 'power',
-            'logarithm': 'log',
-            'sqrt': 'sqrt',
-            'inverse_sqrt': 'inversesqrt',
-            'absolute': 'absval',
-            'exponent': 'exp',
-            'minimum': 'min',
-            'maximum': 'max',
-            'greater_than': 'ifgreater',
-            'less_than': 'ifgreater',
-            'sign': 'sign',
-            'compare': 'compare',
-            'smoothstep': 'smoothstep',
-            'step': 'step',
-            'round': 'round',
-            'floor': 'floor',
-            'ceil': 'ceil',
-            'trunc': 'trunc',
-            'fract': 'fract',
-            'modulo': 'modulo',
-            'wrap': 'wrap',
-            'snap': 'snap',
-            'pingpong': 'pingpong',
-            'sine': 'sin',
-            'cosine': 'cos',
-            'tangent': 'tan',
-            'arcsine': 'asin',
-            'arccosine': 'acos',
-            'arctangent': 'atan',
-            'arctan2': 'atan2',
-            'hyperbolic_sine': 'sinh',
-            'hyperbolic_cosine': 'cosh',
-            'hyperbolic_tangent': 'tanh',
-            'to_radians': 'radians',
-            'to_degrees': 'degrees',
-            'clamp': 'clamp',
-            'mix': 'mix',
-            'smooth_min': 'smoothmin',
-            'smooth_max': 'smoothmax',
-        }
         
-        mtlx_operation = mtlx_operation_map.get(operation, 'add')
+        mtlx_operation = MATH_OPERATION_MAP.get(operation, 'add')
         
         # Create node with enhanced type safety
         node_name = builder.add_node(mtlx_operation, f"{mtlx_operation}_{node.name}", "float")
         
         # Map inputs using enhanced schema
-        if 'MATH' in NODE_SCHEMAS:
-            for entry in NODE_SCHEMAS['MATH']:
-                blender_input = entry['blender']
-                mtlx_param = entry['mtlx']
-                param_type = entry['type']
-                param_category = entry.get('category', 'float')
-                
-                try:
-                    is_connected, value_or_node, type_str = get_input_value_or_connection(node, blender_input, exported_nodes)
-                    
-                    if is_connected:
-                        # Get the correct output name from the source node
-                        source_node_type = None
-                        if exported_nodes:
-                            for node_obj, node_name_in_exported in exported_nodes.items():
-                                if node_name_in_exported == value_or_node:
-                                    source_node_type = node_obj.type
-                                    break
-                        
-                        # Map Blender node type to MaterialX node type
-                        blender_to_mtlx_type = {
-                            'TEX_COORD': 'texcoord',
-                            'RGB': 'constant',
-                            'VALUE': 'constant',
-                            'MIX': 'mix',
-                            'INVERT': 'invert',
-                            'SEPARATE_COLOR': 'separate3',
-                            'COMBINE_COLOR': 'combine3',
-                            'CHECKER_TEXTURE': 'checkerboard',
-                            'GRADIENT_TEXTURE': 'ramplr',
-                            'NOISE_TEXTURE': 'fractal3d',
-                            'WAVE_TEXTURE': 'wave',
-                            'NORMAL_MAP': 'normalmap',
-                            'BUMP': 'bump',
-                            'MAPPING': 'transform2d',
-                            'LAYER_WEIGHT': 'layer',
-                            'MATH': 'add',
-                            'VECTOR_MATH': 'add',
-                            'IMAGE_TEXTURE': 'image',
-                            'BSDF_PRINCIPLED': 'standard_surface',
-                        }
-                        
-                        mtlx_source_type = blender_to_mtlx_type.get(source_node_type, 'constant')
-                        output_name = builder.get_node_output_name(mtlx_source_type)
-                        
-                        builder.add_connection(value_or_node, output_name, node_name, mtlx_param)
-                    else:
-                        # Set default value using type-safe method
-                        default_value = 0.0 if blender_input == 'A' else 0.0
-                        builder.library_builder.node_builder.create_mtlx_input(
-                            builder.nodes[node_name], mtlx_param, 
-                            value=default_value,
-                            node_type=mtlx_operation, category=param_category
-                        )
-                        
-                except (KeyError, AttributeError):
-                    continue
+        _map_math_inputs(node, builder, node_name, 'MATH', mtlx_operation, 'float',
+                         0.0, exported_nodes)
         
         return node_name
     
-    @staticmethod
-    def map_mix_enhanced(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Enhanced mix mapping with type-safe input creation."""
-        return map_node_with_schema_enhanced(node, builder, NODE_SCHEMAS['MIX'], 'mix', 'color3', constant_manager, exported_nodes)
-    
-    @staticmethod
-    def map_invert_enhanced(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Enhanced invert mapping with type-safe input creation."""
-        return map_node_with_schema_enhanced(node, builder, NODE_SCHEMAS['INVERT'], 'invert', 'color3', constant_manager, exported_nodes)
-    
-    @staticmethod
-    def map_separate_color_enhanced(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Enhanced separate color mapping with type-safe input creation."""
-        return map_node_with_schema_enhanced(node, builder, NODE_SCHEMAS['SEPARATE_COLOR'], 'separate3', 'color3', constant_manager, exported_nodes)
-    
-    @staticmethod
-    def map_combine_color_enhanced(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Enhanced combine color mapping with type-safe input creation."""
-        return map_node_with_schema_enhanced(node, builder, NODE_SCHEMAS['COMBINE_COLOR'], 'combine3', 'color3', constant_manager, exported_nodes)
-    
-    @staticmethod
-    def map_checker_texture_enhanced(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Enhanced checker texture mapping with type-safe input creation."""
-        return map_node_with_schema_enhanced(node, builder, NODE_SCHEMAS['CHECKER_TEXTURE'], 'checkerboard', 'color3', constant_manager, exported_nodes)
-    
-    @staticmethod
-    def map_gradient_texture_enhanced(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Enhanced gradient texture mapping with type-safe input creation."""
-        return map_node_with_schema_enhanced(node, builder, NODE_SCHEMAS['GRADIENT_TEXTURE'], 'ramplr', 'color3', constant_manager, exported_nodes)
-    
-    @staticmethod
-    def map_noise_texture_enhanced(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Enhanced noise texture mapping with type-safe input creation."""
-        return map_node_with_schema_enhanced(node, builder, NODE_SCHEMAS['NOISE_TEXTURE'], 'fractal3d', 'color3', constant_manager, exported_nodes)
-    
-    @staticmethod
-    def map_wave_texture_enhanced(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Enhanced wave texture mapping with type-safe input creation."""
-        return map_node_with_schema_enhanced(node, builder, NODE_SCHEMAS['WAVE_TEXTURE'], 'wave', 'color3', constant_manager, exported_nodes)
-    
-    @staticmethod
-    def map_voronoi_texture_enhanced(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Enhanced voronoi texture mapping with type-safe input creation."""
-        return map_node_with_schema_enhanced(node, builder, NODE_SCHEMAS['VORONOI_TEXTURE'], 'voronoi', 'color3', constant_manager, exported_nodes)
-    
-    @staticmethod
-    def map_curve_rgb_enhanced(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Enhanced RGB curves mapping with type-safe input creation."""
-        return map_node_with_schema_enhanced(node, builder, NODE_SCHEMAS['CURVE_RGB'], 'curve', 'color3', constant_manager, exported_nodes)
-    
-    @staticmethod
-    def map_clamp_enhanced(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Enhanced clamp mapping with type-safe input creation."""
-        return map_node_with_schema_enhanced(node, builder, NODE_SCHEMAS['CLAMP'], 'clamp', 'color3', constant_manager, exported_nodes)
-    
-    @staticmethod
-    def map_map_range_enhanced(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Enhanced map range mapping with type-safe input creation."""
-        return map_node_with_schema_enhanced(node, builder, NODE_SCHEMAS['MAP_RANGE'], 'maprange', 'color3', constant_manager, exported_nodes)
+    # Nodes mapped purely from their schema
+    map_mix_enhanced = staticmethod(make_schema_mapper('MIX', 'mix', 'color3', 'mix'))
+    map_invert_enhanced = staticmethod(make_schema_mapper('INVERT', 'invert', 'color3', 'invert'))
+    map_separate_color_enhanced = staticmethod(make_schema_mapper('SEPARATE_COLOR', 'separate3', 'color3', 'separate color'))
+    map_combine_color_enhanced = staticmethod(make_schema_mapper('COMBINE_COLOR', 'combine3', 'color3', 'combine color'))
+    map_checker_texture_enhanced = staticmethod(make_schema_mapper('CHECKER_TEXTURE', 'checkerboard', 'color3', 'checker texture'))
+    map_gradient_texture_enhanced = staticmethod(make_schema_mapper('GRADIENT_TEXTURE', 'ramplr', 'color3', 'gradient texture'))
+    map_noise_texture_enhanced = staticmethod(make_schema_mapper('NOISE_TEXTURE', 'fractal3d', 'color3', 'noise texture'))
+    map_wave_texture_enhanced = staticmethod(make_schema_mapper('WAVE_TEXTURE', 'wave', 'color3', 'wave texture'))
+    map_voronoi_texture_enhanced = staticmethod(make_schema_mapper('VORONOI_TEXTURE', 'voronoi', 'color3', 'voronoi texture'))
+    map_curve_rgb_enhanced = staticmethod(make_schema_mapper('CURVE_RGB', 'curve', 'color3', 'RGB curves'))
+    map_clamp_enhanced = staticmethod(make_schema_mapper('CLAMP', 'clamp', 'color3', 'clamp'))
+    map_map_range_enhanced = staticmethod(make_schema_mapper('MAP_RANGE', 'maprange', 'color3', 'map range'))
     
     # Legacy methods for backward compatibility
-    @staticmethod
-    def map_bump(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Map Bump node to MaterialX bump node."""
-        node_name = builder.add_node("bump", f"bump_{node.name}", "vector3")
-        return node_name
-    
-    @staticmethod
-    def map_mapping(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Map Mapping node to MaterialX transform2d node."""
-        node_name = builder.add_node("transform2d", f"mapping_{node.name}", "vector2")
-        return node_name
-    
-    @staticmethod
-    def map_layer(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Map Layer Weight node to MaterialX layer node."""
-        node_name = builder.add_node("layer", f"layer_{node.name}", "color3")
-        return node_name
-    
-    @staticmethod
-    def map_add(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Map Add node to MaterialX add node."""
-        node_name = builder.add_node("add", f"add_{node.name}", "color3")
-        return node_name
-    
-    @staticmethod
-    def map_multiply(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Map Multiply node to MaterialX multiply node."""
-        node_name = builder.add_node("multiply", f"multiply_{node.name}", "color3")
-        return node_name
-    
-    @staticmethod
-    def map_roughness_anisotropy(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Map Roughness Anisotropy node to MaterialX roughness_anisotropy node."""
-        node_name = builder.add_node("roughness_anisotropy", f"roughness_anisotropy_{node.name}", "vector2")
-        return node_name
-    
-    @staticmethod
-    def map_artistic_ior(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Map Artistic IOR node to MaterialX artistic_ior node."""
-        node_name = builder.add_node("artistic_ior", f"artistic_ior_{node.name}", "float")
-        return node_name
+    map_bump = staticmethod(make_node_only_mapper('bump', 'bump', 'vector3', 'Bump'))
+    map_mapping = staticmethod(make_node_only_mapper('transform2d', 'mapping', 'vector2', 'Mapping'))
+    map_layer = staticmethod(make_node_only_mapper('layer', 'layer', 'color3', 'Layer Weight'))
+    map_add = staticmethod(make_node_only_mapper('add', 'add', 'color3', 'Add'))
+    map_multiply = staticmethod(make_node_only_mapper('multiply', 'multiply', 'color3', 'Multiply'))
+    map_roughness_anisotropy = staticmethod(make_node_only_mapper('roughness_anisotropy', 'roughness_anisotropy', 'vector2', 'Roughness Anisotropy'))
+    map_artistic_ior = staticmethod(make_node_only_mapper('artistic_ior', 'artistic_ior', 'float', 'Artistic IOR'))
     
     @staticmethod
     def map_color_ramp(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
@@ -1546,53 +1631,54 @@ class NodeMapper:
         node_name = builder.add_node("ramp", f"colorramp_{node.name}", "color4")
         
         # Extract Color Ramp data from Blender node
-        if hasattr(node, 'color_ramp'):
-            ramp = node.color_ramp
+        ramp = getattr(node, 'color_ramp', None)
+        ramp_node = builder.nodes.get(node_name)
+        if ramp is not None and ramp_node is not None:
+            # Resolved once for all ramp inputs
+            create_input = builder.library_builder.node_builder.create_mtlx_input
             
             # Set interpolation type
-            interpolation_map = {
-                'LINEAR': 0,
-                'CONSTANT': 2,
-                'EASING': 1,
-                'CARDINAL': 1,
-                'B_SPLINE': 1
-            }
-            interpolation = interpolation_map.get(ramp.interpolation, 1)
+            interpolation = RAMP_INTERPOLATION_MAP.get(ramp.interpolation, 1)
             
-            # Get the number of elements (control points)
-            num_elements = len(ramp.elements)
+            # Get the number of elements (control points); the collection is
+            # resolved once and read in bulk below
+            elements = ramp.elements
+            num_elements = len(elements)
             num_intervals = max(2, num_elements - 1)  # At least 2 intervals
             
             # Set basic ramp properties
-            builder.library_builder.node_builder.create_mtlx_input(
-                builder.nodes[node_name], 'interpolation', 
+            create_input(
+                ramp_node, 'interpolation', 
                 value=interpolation,
                 node_type='ramp', category='color4'
             )
             
-            builder.library_builder.node_builder.create_mtlx_input(
-                builder.nodes[node_name], 'num_intervals', 
+            create_input(
+                ramp_node, 'num_intervals', 
                 value=num_intervals,
                 node_type='ramp', category='color4'
             )
             
+            # Read every control point's position and RGBA color in one bulk
+            # pass each instead of two RNA property reads per element
+            positions = [0.0] * num_elements
+            colors = [0.0] * (num_elements * 4)
+            elements.foreach_get('position', positions)
+            elements.foreach_get('color', colors)
+            
             # Map control points (up to 10 supported by MaterialX)
-            for i in range(min(num_elements, 10)):
-                element = ramp.elements[i]
-                
+            for index, (interval_name, color_name) in enumerate(RAMP_CONTROL_POINT_INPUTS[:num_elements]):
                 # Set interval position
-                interval_name = f'interval{i+1}' if i > 0 else 'interval1'
-                builder.library_builder.node_builder.create_mtlx_input(
-                    builder.nodes[node_name], interval_name, 
-                    value=element.position,
+                create_input(
+                    ramp_node, interval_name, 
+                    value=positions[index],
                     node_type='ramp', category='color4'
                 )
                 
-                # Set color (convert to color4)
-                color_name = f'color{i+1}' if i > 0 else 'color1'
-                color_value = [element.color[0], element.color[1], element.color[2], element.alpha]
-                builder.library_builder.node_builder.create_mtlx_input(
-                    builder.nodes[node_name], color_name, 
+                # Set color (already RGBA, so it maps straight to color4)
+                color_value = colors[index * 4:index * 4 + 4]
+                create_input(
+                    ramp_node, color_name, 
                     value=color_value,
                     node_type='ramp', category='color4'
                 )
@@ -1608,93 +1694,92 @@ class NodeMapper:
         
         return node_name
     
-    @staticmethod
-    def map_hsvtorgb(node, builder, input_nodes, input_nodes_by_index=None, blender_node=None, constant_manager=None, exported_nodes=None):
-        """Map HSV to RGB node to MaterialX hsvtorgb node."""
-        node_name = builder.add_node("hsvtorgb", f"hsvtorgb_{node.name}", "color3")
-        return node_name
-    
-    @staticmethod
-    def map_rgbtohsv(node, builder, input_nodes, input_nodes_by_index=None, blender_node=None, constant_manager=None, exported_nodes=None):
-        """Map RGB to HSV node to MaterialX rgbtohsv node."""
-        node_name = builder.add_node("rgbtohsv", f"rgbtohsv_{node.name}", "color3")
-        return node_name
-    
-    @staticmethod
-    def map_luminance(node, builder, input_nodes, input_nodes_by_index=None, blender_node=None, constant_manager=None, exported_nodes=None):
-        """Map Luminance node to MaterialX luminance node."""
-        node_name = builder.add_node("luminance", f"luminance_{node.name}", "float")
-        return node_name
-    
-    @staticmethod
-    def map_contrast(node, builder, input_nodes, input_nodes_by_index=None, blender_node=None, constant_manager=None, exported_nodes=None):
-        """Map Bright/Contrast node to MaterialX contrast node."""
-        node_name = builder.add_node("contrast", f"contrast_{node.name}", "color3")
-        return node_name
-    
-    @staticmethod
-    def map_saturate(node, builder, input_nodes, input_nodes_by_index=None, blender_node=None, constant_manager=None, exported_nodes=None):
-        """Map Hue Saturation Value node to MaterialX saturate node."""
-        node_name = builder.add_node("saturate", f"saturate_{node.name}", "color3")
-        return node_name
-    
-    @staticmethod
-    def map_gamma(node, builder, input_nodes, input_nodes_by_index=None, blender_node=None, constant_manager=None, exported_nodes=None):
-        """Map Gamma node to MaterialX gamma node."""
-        node_name = builder.add_node("gamma", f"gamma_{node.name}", "color3")
-        return node_name
-    
-    @staticmethod
-    def map_split_color(node, builder, input_nodes, input_nodes_by_index=None, blender_node=None, constant_manager=None, exported_nodes=None):
-        """Map Separate RGB node to MaterialX separate3 node."""
-        node_name = builder.add_node("separate3", f"split_color_{node.name}", "color3")
-        return node_name
-    
-    @staticmethod
-    def map_merge_color(node, builder, input_nodes, input_nodes_by_index=None, blender_node=None, constant_manager=None, exported_nodes=None):
-        """Map Combine RGB node to MaterialX combine3 node."""
-        node_name = builder.add_node("combine3", f"merge_color_{node.name}", "color3")
-        return node_name
-    
-    @staticmethod
-    def map_split_vector(node, builder, input_nodes, input_nodes_by_index=None, blender_node=None, constant_manager=None, exported_nodes=None):
-        """Map Separate XYZ node to MaterialX separate3 node."""
-        node_name = builder.add_node("separate3", f"split_vector_{node.name}", "vector3")
-        return node_name
-    
-    @staticmethod
-    def map_merge_vector(node, builder, input_nodes, input_nodes_by_index=None, blender_node=None, constant_manager=None, exported_nodes=None):
-        """Map Combine XYZ node to MaterialX combine3 node."""
-        node_name = builder.add_node("combine3", f"merge_vector_{node.name}", "vector3")
-        return node_name
-
-
-
-    @staticmethod
-    def map_musgrave_texture_enhanced(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Enhanced musgrave texture mapping with type-safe input creation."""
-        return map_node_with_schema_enhanced(node, builder, NODE_SCHEMAS['TEX_MUSGRAVE'], 'musgrave', 'color3', constant_manager, exported_nodes)
+    map_hsvtorgb = staticmethod(make_node_only_mapper('hsvtorgb', 'hsvtorgb', 'color3', 'HSV to RGB'))
+    map_rgbtohsv = staticmethod(make_node_only_mapper('rgbtohsv', 'rgbtohsv', 'color3', 'RGB to HSV'))
+    map_luminance = staticmethod(make_node_only_mapper('luminance', 'luminance', 'float', 'Luminance'))
+    map_contrast = staticmethod(make_node_only_mapper('contrast', 'contrast', 'color3', 'Bright/Contrast'))
+    map_saturate = staticmethod(make_node_only_mapper('saturate', 'saturate', 'color3', 'Hue Saturation Value'))
+    map_gamma = staticmethod(make_node_only_mapper('gamma', 'gamma', 'color3', 'Gamma'))
+    map_split_color = staticmethod(make_node_only_mapper('separate3', 'split_color', 'color3', 'Separate RGB'))
+    map_merge_color = staticmethod(make_node_only_mapper('combine3', 'merge_color', 'color3', 'Combine RGB'))
+    map_split_vector = staticmethod(make_node_only_mapper('separate3', 'split_vector', 'vector3', 'Separate XYZ'))
+    map_merge_vector = staticmethod(make_node_only_mapper('combine3', 'merge_vector', 'vector3', 'Combine XYZ'))
+    
+    map_musgrave_texture_enhanced = staticmethod(make_schema_mapper('TEX_MUSGRAVE', 'musgrave', 'color3', 'musgrave texture'))
 
     # New utility node mappers
-    @staticmethod
-    def map_geometry_info_enhanced(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Enhanced geometry info mapping with type-safe input creation."""
-        return map_node_with_schema_enhanced(node, builder, NODE_SCHEMAS['NEW_GEOMETRY'], 'position', 'vector3', constant_manager, exported_nodes)
+    map_geometry_info_enhanced = staticmethod(make_schema_mapper('NEW_GEOMETRY', 'position', 'vector3', 'geometry info'))
+    map_object_info_enhanced = staticmethod(make_schema_mapper('OBJECT_INFO', 'constant', 'vector3', 'object info'))
+    map_light_path_enhanced = staticmethod(make_schema_mapper('LIGHT_PATH', 'constant', 'float', 'light path'))
 
-    @staticmethod
-    def map_object_info_enhanced(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Enhanced object info mapping with type-safe input creation."""
-        return map_node_with_schema_enhanced(node, builder, NODE_SCHEMAS['OBJECT_INFO'], 'constant', 'vector3', constant_manager, exported_nodes)
 
-    @staticmethod
-    def map_light_path_enhanced(node, builder: MaterialXBuilder, input_nodes: Dict, input_nodes_by_index: Dict = None, blender_node=None, constant_manager=None, exported_nodes=None) -> str:
-        """Enhanced light path mapping with type-safe input creation."""
-        return map_node_with_schema_enhanced(node, builder, NODE_SCHEMAS['LIGHT_PATH'], 'constant', 'float', constant_manager, exported_nodes)
+# Blender node type -> mapper, built once after NodeMapper is defined instead
+# of on every get_node_mapper() call. Each mapper is listed once with every
+# Blender node type (including legacy aliases) it handles.
+NODE_MAPPERS = {
+    node_type: mapper
+    for mapper, node_types in (
+        (NodeMapper.map_principled_bsdf_enhanced, ('BSDF_PRINCIPLED',)),
+        (NodeMapper.map_image_texture_enhanced, ('TEX_IMAGE',)),
+        (NodeMapper.map_tex_coord, ('TEX_COORD',)),
+        (NodeMapper.map_rgb, ('RGB',)),
+        (NodeMapper.map_value, ('VALUE',)),
+        (NodeMapper.map_normal_map, ('NORMAL_MAP',)),
+        (NodeMapper.map_vector_math_enhanced, ('VECTOR_MATH', 'VECT_MATH')),
+        (NodeMapper.map_math_enhanced, ('MATH',)),
+        (NodeMapper.map_mix_enhanced, ('MIX', 'MIX_RGB', 'MIX_RGB_LEGACY')),
+        (NodeMapper.map_invert_enhanced, ('INVERT',)),
+        (NodeMapper.map_separate_color_enhanced, ('SEPARATE_COLOR',)),
+        (NodeMapper.map_combine_color_enhanced, ('COMBINE_COLOR',)),
+        (NodeMapper.map_bump, ('BUMP',)),
+        (NodeMapper.map_checker_texture_enhanced, ('TEX_CHECKER',)),
+        (NodeMapper.map_gradient_texture_enhanced, ('TEX_GRADIENT',)),
+        (NodeMapper.map_noise_texture_enhanced, ('TEX_NOISE',)),
+        (NodeMapper.map_voronoi_texture_enhanced, ('TEX_VORONOI',)),
+        (NodeMapper.map_curve_rgb_enhanced, ('CURVE_RGB',)),
+        (NodeMapper.map_clamp_enhanced, ('CLAMP',)),
+        (NodeMapper.map_map_range_enhanced, ('MAP_RANGE',)),
+        (NodeMapper.map_mapping, ('MAPPING',)),
+        (NodeMapper.map_layer, ('LAYER',)),
+        (NodeMapper.map_add, ('ADD',)),
+        (NodeMapper.map_multiply, ('MULTIPLY',)),
+        (NodeMapper.map_roughness_anisotropy, ('ROUGHNESS_ANISOTROPY',)),
+        (NodeMapper.map_artistic_ior, ('ARTISTIC_IOR',)),
+        (NodeMapper.map_color_ramp, ('COLORRAMP', 'VALTORGB')),
+        (NodeMapper.map_wave_texture_enhanced, ('WAVE', 'WAVE_TEXTURE', 'TEX_WAVE')),
+        (NodeMapper.map_hsvtorgb, ('HSV_TO_RGB',)),
+        (NodeMapper.map_rgbtohsv, ('RGB_TO_HSV',)),
+        (NodeMapper.map_luminance, ('LUMINANCE',)),
+        (NodeMapper.map_contrast, ('BRIGHT_CONTRAST',)),
+        (NodeMapper.map_saturate, ('HUE_SAT',)),
+        (NodeMapper.map_gamma, ('GAMMA',)),
+        (NodeMapper.map_split_color, ('SEPARATE_RGB',)),
+        (NodeMapper.map_merge_color, ('COMBINE_RGB',)),
+        (NodeMapper.map_split_vector, ('SEPARATE_XYZ',)),
+        (NodeMapper.map_merge_vector, ('COMBINE_XYZ',)),
+        (NodeMapper.map_musgrave_texture_enhanced, ('TEX_MUSGRAVE',)),
+        (NodeMapper.map_geometry_info_enhanced, ('NEW_GEOMETRY',)),
+        (NodeMapper.map_object_info_enhanced, ('OBJECT_INFO',)),
+        (NodeMapper.map_light_path_enhanced, ('LIGHT_PATH',)),
+    )
+    for node_type in node_types
+}
 
 
 class MaterialXExporter:
     """Main MaterialX exporter class with Phase 3 enhancements."""
     
+    __slots__ = (
+        'material', 'output_path', 'options', 'logger',
+        'active_uvmap', 'export_textures', 'texture_path', 'materialx_version',
+        'copy_textures', 'relative_paths', 'strict_mode',
+        'optimize_document', 'advanced_validation', 'performance_monitoring',
+        'exported_nodes', 'exported_nodes_by_name', 'node_links', 'texture_paths',
+        'builder', 'unsupported_nodes', 'constant_manager',
+        'document_validated',
+        'export_start_time', 'export_end_time',
+    )
+    
     def __init__(self, material: bpy.types.Material, output_path: str, logger, options: Dict = None):
         self.material = material
         self.output_path = Path(output_path)
@@ -1719,11 +1804,16 @@ class MaterialXExporter:
         
         # Internal state
         self.exported_nodes = {}
+        self.exported_nodes_by_name = {}  # MaterialX node name -> Blender node
+        self.node_links = {}  # Blender node -> [(input index, input name, source node)]
         self.texture_paths = {}
         self.builder = None
         self.unsupported_nodes = []
         self.constant_manager = ConstantManager()
         
+        # Set once validate() has run, so the write can skip a second pass
+        self.document_validated = False
+        
         # Performance tracking
         self.export_start_time = None
         self.export_end_time = None
@@ -1770,13 +1860,13 @@ class MaterialXExporter:
                 self.logger.error("💡 Available node types in your material:")
                 
                 # Check for unsupported nodes and record them
-                node_types = []
+                node_types = set()
                 for node in self.material.node_tree.nodes:
-                    node_types.append(node.type)
+                    node_types.add(node.type)
                     self.logger.error(f"    - {node.name}: {node.type}")
                     
                     # Check if this is an unsupported node type
-                    if node.type in ['EMISSION', 'FRESNEL']:
+                    if node.type in UNSUPPORTED_SHADER_NODE_TYPES:
                         self.unsupported_nodes.append({
                             "name": node.name,
                             "type": node.type
@@ -1786,7 +1876,7 @@ class MaterialXExporter:
                 if 'EMISSION' in node_types:
                     self.logger.error("💡 Suggestion: Replace the Emission shader with a Principled BSDF node.")
                     self.logger.error("💡 Use 'Emission Color' and 'Emission Strength' inputs on the Principled BSDF instead.")
-                elif 'BSDF_DIFFUSE' in node_types or 'BSDF_GLOSSY' in node_types or 'BSDF_GLASS' in node_types:
+                elif not node_types.isdisjoint(SEPARATE_BSDF_NODE_TYPES):
                     self.logger.error("💡 Suggestion: Replace individual BSDF shaders with a single Principled BSDF node.")
                     self.logger.error("💡 Principled BSDF combines all these effects in one node with better control.")
                 else:
@@ -1794,17 +1884,14 @@ class MaterialXExporter:
                     self.logger.error("💡 The Principled BSDF is the standard shader for physically-based rendering in Blender.")
                 
                 # Check if we should continue despite unsupported nodes
-                print(f"DEBUG: Checking strict mode: {self.strict_mode}")
                 self.logger.info(f"Checking strict mode: {self.strict_mode}")
                 if self.strict_mode:
-                    print("DEBUG: Strict mode enabled - failing export")
                     self.logger.info("Strict mode enabled - failing export")
                     result["error"] = "No Principled BSDF node found"
                     result["unsupported_nodes"] = self.unsupported_nodes
                     return result
                 else:
                     # Continue with a basic material export
-                    print("DEBUG: Strict mode disabled - continuing export")
                     self.logger.warning("⚠ Continuing export despite unsupported nodes...")
                     return self._export_basic_material()
             
@@ -1820,8 +1907,7 @@ class MaterialXExporter:
                 self.builder.set_write_options(
                     skip_library_elements=True,
                     write_xinclude=False,
-                    remove_layout=True,
-                    format_output=True
+                    remove_layout=True
                 )
             
             self.logger.info("Starting node network export...")
@@ -1843,6 +1929,7 @@ class MaterialXExporter:
             if self.advanced_validation:
                 self.logger.info("Performing advanced validation...")
                 validation_success = self.builder.validate()
+                self.document_validated = True
                 result["validation_results"] = {
                     "valid": validation_success,
                     "details": "See log for detailed validation results"
@@ -1900,16 +1987,18 @@ class MaterialXExporter:
         # Create a basic standard_surface shader outside the nodegraph
         surface_node = self.builder.add_surface_shader_node("standard_surface", "surface_basic")
         
-        # Add inputs with values directly
+        # Add inputs with values directly. Numeric values are passed as-is:
+        # the node builder converts and formats them (with caching), whereas
+        # a pre-formatted "r, g, b" string would have to be parsed back.
         self.builder.add_surface_shader_input(
             surface_node, "base_color", "color3",
-            value=str(f"{self.material.diffuse_color[0]}, {self.material.diffuse_color[1]}, {self.material.diffuse_color[2]}"))
+            value=tuple(self.material.diffuse_color[:3]))
         self.builder.add_surface_shader_input(
             surface_node, "roughness", "float",
-            value=str(self.material.roughness))
+            value=self.material.roughness)
         self.builder.add_surface_shader_input(
             surface_node, "metallic", "float",
-            value=str(self.material.metallic))
+            value=self.material.metallic)
         
         self.builder.set_material_surface(surface_node)
         self._write_file()
@@ -1942,48 +2031,67 @@ class MaterialXExporter:
             self.logger.info(f"  {i+1}. {node.name} ({node.type})")
         
         # Export nodes in dependency order
-        self.logger.info("Exporting nodes in dependency order...")
+        log_info = self.logger.info
+        exported_nodes = self.exported_nodes
+        export_node = self._export_node
+        total = len(dependencies)
+        log_info("Exporting nodes in dependency order...")
         for i, node in enumerate(dependencies):
-            if node not in self.exported_nodes:
-                self.logger.info(f"Exporting node {i+1}/{len(dependencies)}: {node.name} ({node.type})")
+            if node not in exported_nodes:
+                log_info(f"Exporting node {i+1}/{total}: {node.name} ({node.type})")
                 try:
-                    self._export_node(node)
-                    self.logger.info(f"  ✓ Successfully exported {node.name}")
+                    export_node(node)
+                    log_info(f"  ✓ Successfully exported {node.name}")
                 except Exception as e:
                     # Don't log the error again since _export_node already logged helpful messages
                     raise
             else:
-                self.logger.info(f"Skipping already exported node: {node.name}")
+                log_info(f"Skipping already exported node: {node.name}")
         
-        result = self.exported_nodes[output_node]
-        self.logger.info(f"Node network export completed. Final surface node: {result}")
+        result = exported_nodes[output_node]
+        log_info(f"Node network export completed. Final surface node: {result}")
         return result
     
     def _build_dependencies(self, output_node: bpy.types.Node) -> List[bpy.types.Node]:
-        """Build a list of nodes in dependency order."""
-        visited = set()
-        dependencies = []
+        """
+        Build a list of nodes in dependency order.
         
-        def visit(node):
-            if node in visited:
-                return
-            visited.add(node)
-            
-            # Visit input nodes first
-            for input_socket in node.inputs:
-                if input_socket.links:
-                    input_node = input_socket.links[0].from_node
-                    visit(input_node)
-            
-            dependencies.append(node)
+        The linked inputs found while walking are recorded in self.node_links
+        so that _export_node does not have to scan node.inputs again.
+        """
+        visited = {output_node}
+        dependencies = []
+        node_links = self.node_links
+        
+        def linked_inputs(node):
+            links = [(i, input_socket.name, input_socket.links[0].from_node)
+                     for i, input_socket in enumerate(node.inputs) if input_socket.links]
+            node_links[node] = links
+            return iter(links)
+        
+        # Iterative post-order walk (input nodes first); an explicit stack
+        # avoids Python recursion overhead and depth limits on deep trees.
+        stack = [(output_node, linked_inputs(output_node))]
+        while stack:
+            node, pending_links = stack[-1]
+            for _, _, input_node in pending_links:
+                if input_node not in visited:
+                    visited.add(input_node)
+                    stack.append((input_node, linked_inputs(input_node)))
+                    break
+            else:
+                stack.pop()
+                dependencies.append(node)
         
-        visit(output_node)
         return dependencies
     
     def _export_node(self, node: bpy.types.Node) -> str:
         """Export a single node."""
-        self.logger.info(f"  Processing node: {node.name} (type: {node.type})")
-        self.logger.info(f"  *** ENTERING _export_node for {node.name} ***")
+        # Per-node tracing is formatted only when INFO records are emitted
+        verbose = self.logger.isEnabledFor(logging.INFO)
+        if verbose:
+            self.logger.info(f"  Processing node: {node.name} (type: {node.type})")
+            self.logger.info(f"  *** ENTERING _export_node for {node.name} ***")
         # Get the mapper for this node type
         mapper = NodeMapper.get_node_mapper(node.type)
         if not mapper:
@@ -1991,43 +2099,45 @@ class MaterialXExporter:
             self.logger.warning(f"  Available mappers: {list(NodeMapper.get_node_mapper.__defaults__ or [])}")
             
             # Provide specific guidance for common unsupported node types
-            if node.type == 'EMISSION':
-                self.logger.error(f"  ✗ Emission shader '{node.name}' is not supported.")
-                self.logger.error(f"  💡 Suggestion: Replace with Principled BSDF and use 'Emission Color' and 'Emission Strength' inputs instead.")
-                self.logger.error(f"  💡 This addon only supports materials that use Principled BSDF nodes.")
-            elif node.type == 'FRESNEL':
-                self.logger.error(f"  ✗ Fresnel node '{node.name}' is not supported.")
-                self.logger.error(f"  💡 Suggestion: Remove this node and use Principled BSDF's built-in fresnel effects via 'Specular IOR Level' and 'IOR' inputs.")
-                self.logger.error(f"  💡 Principled BSDF has built-in fresnel calculations that are more accurate and efficient.")
-            else:
-                self.logger.error(f"  ✗ Node type '{node.type}' ({node.name}) is not supported.")
-                self.logger.error(f"  💡 Suggestion: Use only supported node types or replace with equivalent Principled BSDF functionality.")
+            guidance = UNSUPPORTED_NODE_GUIDANCE.get(node.type, GENERIC_UNSUPPORTED_NODE_GUIDANCE)
+            for message in guidance:
+                self.logger.error(message.format(name=node.name, type=node.type))
             
             if self.strict_mode:
                 raise RuntimeError(f"Unsupported node type encountered: {node.type} ({node.name})")
             return self._export_unknown_node(node)
-        self.logger.info(f"  Found mapper for {node.type}")
+        if verbose:
+            self.logger.info(f"  Found mapper for {node.type}")
         # Build input nodes dictionary - handle duplicate input names
         input_nodes = {}
         input_nodes_by_index = {}  # Store by index for nodes with duplicate names
-        for i, input_socket in enumerate(node.inputs):
-            if input_socket.links:
-                input_node = input_socket.links[0].from_node
-                if input_node not in self.exported_nodes:
-                    self._export_node(input_node)
-                input_nodes[input_socket.name] = self.exported_nodes[input_node]
-                input_nodes_by_index[i] = self.exported_nodes[input_node]
-                self.logger.info(f"    Input {i} '{input_socket.name}' connected to {input_node.name}")
-        self.logger.info(f"  Input nodes: {list(input_nodes.keys())}")
-        self.logger.info(f"  Input nodes by index: {list(input_nodes_by_index.keys())}")
-        self.logger.info(f"  Input nodes by index values: {input_nodes_by_index}")
-        self.logger.info(f"  *** DEBUG: Node {node.name} has {len(input_nodes_by_index)} indexed inputs ***")
+        links = self.node_links.get(node)
+        if links is None:
+            links = [(i, input_socket.name, input_socket.links[0].from_node)
+                     for i, input_socket in enumerate(node.inputs) if input_socket.links]
+        exported_nodes = self.exported_nodes
+        for i, input_name, input_node in links:
+            source_name = exported_nodes.get(input_node)
+            if source_name is None:
+                self._export_node(input_node)
+                source_name = exported_nodes[input_node]
+            input_nodes[input_name] = source_name
+            input_nodes_by_index[i] = source_name
+            if verbose:
+                self.logger.info(f"    Input {i} '{input_name}' connected to {input_node.name}")
+        if verbose:
+            self.logger.info(f"  Input nodes: {list(input_nodes.keys())}")
+            self.logger.info(f"  Input nodes by index: {list(input_nodes_by_index.keys())}")
+            self.logger.info(f"  Input nodes by index values: {input_nodes_by_index}")
+            self.logger.info(f"  *** DEBUG: Node {node.name} has {len(input_nodes_by_index)} indexed inputs ***")
         # Map the node
         try:
             # Pass constant_manager to schema-driven mappers
             node_name = mapper(node, self.builder, input_nodes, input_nodes_by_index, node, self.constant_manager, self.exported_nodes)
             self.exported_nodes[node] = node_name
-            self.logger.info(f"  Mapped to: {node_name}")
+            self.exported_nodes_by_name[node_name] = node
+            if verbose:
+                self.logger.info(f"  Mapped to: {node_name}")
             return node_name
         except Exception as e:
             self.logger.error(f"  Error in mapper for {node.type}: {str(e)}")
@@ -2042,8 +2152,9 @@ class MaterialXExporter:
             "type": node.type
         })
         node_name = self.builder.add_node("constant", f"unknown_{node.name}", "color3",
-                                        value=[1.0, 0.0, 1.0])  # Magenta for unknown nodes
+                                        value=UNKNOWN_NODE_COLOR)
         self.exported_nodes[node] = node_name
+        self.exported_nodes_by_name[node_name] = node
         return node_name
     
     def _write_file(self):
@@ -2056,7 +2167,9 @@ class MaterialXExporter:
             self.logger.info(f"Writing MaterialX content to: {self.output_path}")
             
             # Use library-based writing with Phase 3 enhancements
-            success = self.builder.write_to_file(str(self.output_path))
+            # The document was already validated in export() when advanced
+            # validation is on, so don't run the same pass again here.
+            success = self.builder.write_to_file(str(self.output_path), validate=not self.document_validated)
             if success:
                 self.logger.info(f"Successfully wrote MaterialX document using library")
                 
@@ -2085,15 +2198,23 @@ class MaterialXExporter:
         # Ensure texture directory exists
         self.texture_path.mkdir(parents=True, exist_ok=True)
         
-        # Find all image textures
+        # Find all image textures; an image shared by several texture nodes
+        # is exported once
+        exported_images = set()
         for node in self.material.node_tree.nodes:
-            if node.type == 'TEX_IMAGE' and node.image:
+            if node.type == 'TEX_IMAGE' and node.image and node.image not in exported_images:
+                exported_images.add(node.image)
                 self._export_texture(node.image)
     
     def _export_texture(self, image: bpy.types.Image):
         """Export a single texture file."""
         if not image.filepath:
             return
+        # Already resolved (and copied) for this export
+        if image.filepath in self.texture_paths:
+            return
+        
+        import bpy
         
         source_path = Path(bpy.path.abspath(image.filepath))
         if not source_path.exists():
@@ -2121,11 +2242,14 @@ def format_socket_value(value):
     Format a Blender socket value for MaterialX XML.
     Handles scalars, tuples, lists, and Blender's bpy_prop_array types.
     """
+    if isinstance(value, (int, float)):
+        return str(float(value))
     # Blender's vector types can be mathutils.Vector, or bpy_prop_array, or tuple/list
-    if hasattr(value, "__len__") and not isinstance(value, str):
+    if (type(value).__name__ in _BLENDER_ARRAY_TYPE_NAMES or isinstance(value, (list, tuple))
+            or (hasattr(value, "__len__") and not isinstance(value, str))):
         try:
             # Try to convert to list of floats
-            return ", ".join(str(float(v)) for v in value)
+            return ", ".join(map(str, map(float, value)))
         except Exception:
             return str(value)
     else:
@@ -2181,6 +2305,10 @@ def export_all_materials_to_materialx(output_directory: str, logger, options: Di
     """
     Export all materials in the current scene to MaterialX format.
     
+    Materials are exported one at a time on the calling thread: the mappers
+    read bpy data, which is not thread-safe, and the MaterialX calls that
+    build and write documents hold the GIL, so worker threads gain nothing.
+    
     Args:
         output_directory: Directory to save .mtlx files
         options: Export options dictionary
@@ -2188,6 +2316,8 @@ def export_all_materials_to_materialx(output_directory: str, logger, options: Di
     Returns:
         Dict[str, bool]: Dictionary mapping material names to success status
     """
+    import bpy
+    
     results = {}
     output_dir = Path(output_directory)
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -21,6 +21,8 @@ Phase 3: Advanced Features Integration
 - Performance optimization and memory management
 - Error recovery and robustness features
 """
+from __future__ import annotations
+
 print("DEBUG: MaterialX library core module loaded")
 
 import MaterialX as mx
@@ -28,27 +30,164 @@ import os
 import sys
 import time
 import gc
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
+import re
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Any
 import logging
 
-# Import mtlxutils
+# Import mtlxutils (only the file utilities are used by this module)
 try:
-    from . import mtlxutils
-    from .mtlxutils import mxbase as mxb
     from .mtlxutils import mxfile as mxf
-    from .mtlxutils import mxnodegraph as mxg
-    from .mtlxutils import mxtraversal as mxt
 
 except ImportError:
     # Fallback for direct import
-    import mtlxutils
-    import mtlxutils.mxbase as mxb
     import mtlxutils.mxfile as mxf
-    import mtlxutils.mxnodegraph as mxg
-    import mtlxutils.mxtraversal as mxt
 
 
+# Punctuation that Blender commonly puts in node names ("Image Texture.001",
+# "Mix (Legacy)") mapped to the MaterialX replacement character.
+_NAME_SANITIZE_TABLE = str.maketrans({c: '_' for c in ' .-()[]/\\,;'})
+_VALID_NAME_RE = re.compile(r'[A-Za-z0-9_]*')
+
+
+# Bound formatter for MaterialX float components, reused by value formatting
+_format_float = "{:.4g}".format
+
+# Vector/color type -> (component count, bound formatter for that many
+# components), so value formatting dispatches with a single dict lookup
+_VECTOR_VALUE_FORMATS = {
+    'vector2': (2, "{:.4g},{:.4g}".format),
+    'color3': (3, "{:.4g},{:.4g},{:.4g}".format),
+    'vector3': (3, "{:.4g},{:.4g},{:.4g}".format),
+    'color4': (4, "{:.4g},{:.4g},{:.4g},{:.4g}".format),
+    'vector4': (4, "{:.4g},{:.4g},{:.4g},{:.4g}".format),
+}
+_STRING_VALUE_TYPES = frozenset(('string', 'filename'))
+
+# Component count -> MaterialX type inferred for untyped sequence parameters
+_SEQUENCE_PARAM_TYPES = {2: 'vector2', 3: 'color3', 4: 'color4'}
+
+# Expected MaterialX type of common input names, for inputs with no nodedef
+# information (shared by the node builder and the connection manager)
+_INPUT_TYPE_MAP = {
+    'texcoord': 'vector2',
+    'in': 'color3',
+    'in1': 'color3',
+    'in2': 'color3',
+    'a': 'color3',
+    'b': 'color3',
+    'factor': 'float',
+    'scale': 'float',
+    'strength': 'float',
+    'amount': 'float',
+    'pivot': 'vector2',
+    'translate': 'vector2',
+    'rotate': 'float',
+    'file': 'filename',
+    'default': 'color3',
+    'surfaceshader': 'surfaceshader',
+    'normal': 'vector3',
+    'tangent': 'vector3',
+
+    # Standard surface specific mappings
+    'base': 'float',
+    'base_color': 'color3',
+    'metalness': 'float',
+    'specular': 'float',
+    'specular_color': 'color3',
+    'specular_roughness': 'float',
+    'specular_ior': 'float',
+    'transmission': 'float',
+    'transmission_color': 'color3',
+    'transmission_depth': 'float',
+    'transmission_scatter': 'color3',
+    'transmission_scatter_anisotropy': 'float',
+    'transmission_dispersion': 'float',
+    'transmission_extra_roughness': 'float',
+    'opacity': 'color3',
+    'emission': 'float',
+    'emission_color': 'color3',
+    'subsurface': 'float',
+    'subsurface_color': 'color3',
+    'subsurface_radius': 'color3',
+    'subsurface_scale': 'float',
+    'subsurface_anisotropy': 'float',
+    'sheen': 'float',
+    'sheen_color': 'color3',
+    'sheen_tint': 'float',
+    'sheen_roughness': 'float',
+    'coat': 'float',
+    'coat_color': 'color3',
+    'coat_roughness': 'float',
+    'coat_ior': 'float',
+    'coat_normal': 'vector3',
+    'anisotropic': 'float',
+    'anisotropic_rotation': 'float',
+    'anisotropic_direction': 'vector3',
+}
+
+
+def _input_type_from_name(input_name: str) -> str:
+    """Guess an input's MaterialX type from its name (default: color3)."""
+    # Names are usually lowercase already, so try them before lowering
+    return _INPUT_TYPE_MAP.get(input_name) or _INPUT_TYPE_MAP.get(input_name.lower(), 'color3')
+
+
+# Connection queries differ between MaterialX releases; detect them once
+# rather than probing every port during validation
+_HAS_CONNECTED_NODE_API = hasattr(mx.Input, 'getConnectedNode')
+_HAS_CONNECTIONS_API = hasattr(mx.Output, 'getConnections')
+
+# MaterialX 1.39+ can reference the libraries as a data library instead of
+# copying every definition into each working document with importLibrary
+_HAS_DATA_LIBRARY_API = hasattr(mx.Document, 'setDataLibrary')
+
+# Standard libraries document shared by every document manager, loaded once
+# per search path. It is read-only once loaded: working documents only copy
+# from it (importLibrary) or reference it (setDataLibrary), and nothing may
+# modify it. The lock only serializes the first load; the exporter builds and
+# writes documents on the calling thread.
+_SHARED_LIBRARIES = None
+_SHARED_LIBRARY_FILES = []
+_SHARED_LIBRARY_SEARCH_PATH = None
+_SHARED_LIBRARIES_LOCK = threading.Lock()
+
+
+def _get_shared_libraries(lib_folders, search_path):
+    """
+    Return the shared (libraries document, library files) for a search path,
+    loading and parsing the libraries only the first time.
+    
+    The returned document is shared and must be treated as read-only.
+    """
+    global _SHARED_LIBRARIES, _SHARED_LIBRARY_FILES, _SHARED_LIBRARY_SEARCH_PATH
+    search_path_key = search_path.asString()
+    with _SHARED_LIBRARIES_LOCK:
+        if _SHARED_LIBRARIES is None or _SHARED_LIBRARY_SEARCH_PATH != search_path_key:
+            libraries = mx.createDocument()
+            library_files = mx.loadLibraries(lib_folders, search_path, libraries)
+            _SHARED_LIBRARIES = libraries
+            _SHARED_LIBRARY_FILES = library_files
+            _SHARED_LIBRARY_SEARCH_PATH = search_path_key
+        return _SHARED_LIBRARIES, _SHARED_LIBRARY_FILES
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_name(name: str) -> str:
+    """
+    Return a valid MaterialX element name, like mx.createValidName().
+    
+    Common cases are handled with a single str.translate() pass; names with
+    any other character fall back to MaterialX itself. Results are memoized,
+    since the same '<type>_<blender node name>' names recur across exports.
+    """
+    valid_name = name.translate(_NAME_SANITIZE_TABLE)
+    if _VALID_NAME_RE.fullmatch(valid_name):
+        return valid_name
+    return mx.createValidName(valid_name)
+
 
 class MaterialXConfig:
     """Configuration system for MaterialX export settings."""
@@ -65,7 +204,6 @@ class MaterialXConfig:
         'skip_library_elements': True,
         'write_xinclude': False,
         'remove_layout': True,
-        'format_output': True,
         
         # Error handling
         'strict_mode': True,
@@ -115,8 +253,7 @@ class MaterialXConfig:
         return {
             'skip_library_elements': self.get('skip_library_elements'),
             'write_xinclude': self.get('write_xinclude'),
-            'remove_layout': self.get('remove_layout'),
-            'format_output': self.get('format_output')
+            'remove_layout': self.get('remove_layout')
         }
 
 
@@ -128,6 +265,19 @@ class MaterialXValidationError(Exception):
 class MaterialXError(Exception):
     """Base class for MaterialX-specific errors with classification."""
     
+    # User-facing message per error type (shared by all errors)
+    error_messages = {
+        "library_loading": "Failed to load MaterialX libraries. Please check your MaterialX installation.",
+        "node_creation": "Failed to create MaterialX node. The node type may not be supported.",
+        "connection_error": "Failed to connect nodes. There may be a type mismatch.",
+        "validation_error": "MaterialX document validation failed. Check the material setup.",
+        "file_write": "Failed to write MaterialX file. Check file permissions and disk space.",
+        "type_conversion": "Failed to convert data types. Check input values.",
+        "unsupported_node": "This Blender node type is not supported in MaterialX export.",
+        "performance_warning": "Export completed but performance issues were detected.",
+        "memory_error": "Insufficient memory for export operation."
+    }
+    
     def __init__(self, message: str, error_type: str = "general", details: Dict = None):
         super().__init__(message)
         self.error_type = error_type
@@ -135,18 +285,7 @@ class MaterialXError(Exception):
     
     def get_user_friendly_message(self) -> str:
         """Get a user-friendly error message."""
-        error_messages = {
-            "library_loading": "Failed to load MaterialX libraries. Please check your MaterialX installation.",
-            "node_creation": "Failed to create MaterialX node. The node type may not be supported.",
-            "connection_error": "Failed to connect nodes. There may be a type mismatch.",
-            "validation_error": "MaterialX document validation failed. Check the material setup.",
-            "file_write": "Failed to write MaterialX file. Check file permissions and disk space.",
-            "type_conversion": "Failed to convert data types. Check input values.",
-            "unsupported_node": "This Blender node type is not supported in MaterialX export.",
-            "performance_warning": "Export completed but performance issues were detected.",
-            "memory_error": "Insufficient memory for export operation."
-        }
-        return error_messages.get(self.error_type, str(self))
+        return self.error_messages.get(self.error_type, str(self))
 
 
 class MaterialXPerformanceMonitor:
@@ -160,6 +299,8 @@ class MaterialXPerformanceMonitor:
     - Resource cleanup monitoring
     """
     
+    __slots__ = ('logger', 'operation_times', 'memory_snapshots', 'start_time', 'enabled')
+    
     def __init__(self, logger):
         self.logger = logger
         self.operation_times = {}
@@ -189,7 +330,7 @@ class MaterialXPerformanceMonitor:
         duration = end_time - timing['start']
         memory_delta = memory_after - timing['memory_before']
         
-        self.logger.debug(f"Operation '{operation_name}': {duration:.4f}s, Memory: {memory_delta:+d} bytes")
+        self.logger.debug("Operation '%s': %.4fs, Memory: %+d bytes", operation_name, duration, memory_delta)
         
         # Performance warnings
         if duration > 1.0:
@@ -197,14 +338,23 @@ class MaterialXPerformanceMonitor:
         if memory_delta > 10 * 1024 * 1024:  # 10MB
             self.logger.warning(f"High memory usage detected: '{operation_name}' used {memory_delta / (1024*1024):.2f}MB")
     
+    # psutil.Process handle shared by all monitors; resolved on first use.
+    # False means psutil is not available.
+    _process = None
+    
     def _get_memory_usage(self) -> int:
         """Get current memory usage in bytes."""
-        try:
-            import psutil
-            process = psutil.Process()
-            return process.memory_info().rss
-        except ImportError:
+        process = MaterialXPerformanceMonitor._process
+        if process is None:
+            try:
+                import psutil
+                process = psutil.Process()
+            except ImportError:
+                process = False
+            MaterialXPerformanceMonitor._process = process
+        if process is False:
             return 0
+        return process.memory_info().rss
     
     def suggest_optimizations(self) -> List[str]:
         """Analyze performance data and suggest optimizations."""
@@ -213,13 +363,15 @@ class MaterialXPerformanceMonitor:
         if not self.operation_times:
             return suggestions
         
-        # Find slowest operations
-        slow_operations = [(name, data.get('duration', 0)) 
-                          for name, data in self.operation_times.items()]
-        slow_operations.sort(key=lambda x: x[1], reverse=True)
+        # Find the slowest operation in a single pass; only the top one is reported
+        slowest_name, slowest_duration = None, 0
+        for name, data in self.operation_times.items():
+            duration = data.get('duration', 0)
+            if slowest_name is None or duration > slowest_duration:
+                slowest_name, slowest_duration = name, duration
         
-        if slow_operations and slow_operations[0][1] > 0.5:
-            suggestions.append(f"Consider optimizing '{slow_operations[0][0]}' (took {slow_operations[0][1]:.4f}s)")
+        if slowest_duration > 0.5:
+            suggestions.append(f"Consider optimizing '{slowest_name}' (took {slowest_duration:.4f}s)")
         
         return suggestions
     
@@ -269,18 +421,22 @@ class MaterialXAdvancedValidator:
         }
         
         try:
+            # Walk the document once and share the snapshot across passes
+            nodes = list(document.getNodes())
+            document_child_names = {child.getName() for child in document.getChildren()}
+            
             # Basic document validation
-            if not self._validate_basic_structure(document, results):
+            if not self._validate_basic_structure(document, results, nodes):
                 results['valid'] = False
             
             # Node validation
-            self._validate_nodes(document, results)
+            self._validate_nodes(document, results, nodes, document_child_names)
             
             # Connection validation
-            self._validate_connections(document, results)
+            self._validate_connections(document, results, nodes, document_child_names)
             
             # Performance validation
-            self._validate_performance(document, results)
+            self._validate_performance(document, results, nodes)
             
             # Custom validation rules
             self._apply_custom_validators(document, results)
@@ -292,7 +448,8 @@ class MaterialXAdvancedValidator:
         
         return results
     
-    def _validate_basic_structure(self, document: mx.Document, results: Dict[str, Any]) -> bool:
+    def _validate_basic_structure(self, document: mx.Document, results: Dict[str, Any],
+                                  nodes: Optional[List[mx.Node]] = None) -> bool:
         """Validate basic document structure."""
         try:
             # Check for required elements
@@ -301,7 +458,7 @@ class MaterialXAdvancedValidator:
                 results['warnings'].append("No material nodes found in document")
             
             # Check for surface shaders - get all nodes and filter by type
-            all_nodes = document.getNodes()
+            all_nodes = document.getNodes() if nodes is None else nodes
             surface_shaders = [node for node in all_nodes if node.getType() == 'surfaceshader']
             if not surface_shaders:
                 results['warnings'].append("No surface shader nodes found in document")
@@ -317,10 +474,16 @@ class MaterialXAdvancedValidator:
             results['errors'].append(f"Basic structure validation failed: {str(e)}")
             return False
     
-    def _validate_nodes(self, document: mx.Document, results: Dict[str, Any]):
+    def _validate_nodes(self, document: mx.Document, results: Dict[str, Any],
+                        nodes: Optional[List[mx.Node]] = None,
+                        document_child_names: Optional[Set[str]] = None):
         """Validate all nodes in the document."""
         try:
-            nodes = document.getNodes()
+            if nodes is None:
+                nodes = document.getNodes()
+            # Snapshot top-level names once instead of a getChild() per input
+            if document_child_names is None:
+                document_child_names = {child.getName() for child in document.getChildren()}
             for node in nodes:
                 # Check node definition
                 nodedef = node.getNodeDef()
@@ -329,65 +492,65 @@ class MaterialXAdvancedValidator:
                     continue
                 
                 # Check input connections - use MaterialX 1.39 compatible API
-                for input_elem in node.getInputs():
-                    try:
-                        # Check if input has a connection
-                        if hasattr(input_elem, 'getConnectedNode'):
+                if _HAS_CONNECTED_NODE_API:
+                    for input_elem in node.getInputs():
+                        try:
                             connected_node = input_elem.getConnectedNode()
-                            if connected_node:
-                                # Validate the connected node exists
-                                if not document.getChild(connected_node.getName()):
-                                    results['warnings'].append(f"Input '{input_elem.getName()}' on node '{node.getName()}' connects to non-existent node")
-                    except Exception as e:
-                        # Skip validation for this input if API is not available
-                        pass
+                            # Validate the connected node exists
+                            if connected_node and connected_node.getName() not in document_child_names:
+                                results['warnings'].append(f"Input '{input_elem.getName()}' on node '{node.getName()}' connects to non-existent node")
+                        except Exception as e:
+                            # A bad port is reported on its own; keep checking the rest
+                            results['warnings'].append(f"Could not validate input '{input_elem.getName()}' on node '{node.getName()}': {str(e)}")
                 
                 # Check output connections - use MaterialX 1.39 compatible API
-                for output_elem in node.getOutputs():
-                    try:
-                        # Check if output has connections
-                        if hasattr(output_elem, 'getConnections'):
-                            connections = output_elem.getConnections()
-                            if connections:
-                                for connection in connections:
-                                    if hasattr(connection, 'getDownstreamElement'):
-                                        downstream = connection.getDownstreamElement()
-                                        if downstream and not document.getChild(downstream.getName()):
-                                            results['warnings'].append(f"Output '{output_elem.getName()}' on node '{node.getName()}' connects to non-existent node")
-                    except Exception as e:
-                        # Skip validation for this output if API is not available
-                        pass
+                if _HAS_CONNECTIONS_API:
+                    for output_elem in node.getOutputs():
+                        try:
+                            for connection in output_elem.getConnections() or ():
+                                downstream = connection.getDownstreamElement()
+                                if downstream and downstream.getName() not in document_child_names:
+                                    results['warnings'].append(f"Output '{output_elem.getName()}' on node '{node.getName()}' connects to non-existent node")
+                        except Exception as e:
+                            results['warnings'].append(f"Could not validate output '{output_elem.getName()}' on node '{node.getName()}': {str(e)}")
                         
         except Exception as e:
             results['errors'].append(f"Node validation failed: {str(e)}")
     
-    def _validate_connections(self, document: mx.Document, results: Dict[str, Any]):
+    def _validate_connections(self, document: mx.Document, results: Dict[str, Any],
+                              nodes: Optional[List[mx.Node]] = None,
+                              document_child_names: Optional[Set[str]] = None):
         """Validate all connections in the document."""
         try:
             # Use MaterialX 1.39 compatible connection analysis
-            nodes = document.getNodes()
+            if nodes is None:
+                nodes = document.getNodes()
+            if document_child_names is None:
+                document_child_names = {child.getName() for child in document.getChildren()}
+            if not _HAS_CONNECTED_NODE_API:
+                return
             for node in nodes:
                 # Check input connections
                 for input_elem in node.getInputs():
                     try:
-                        if hasattr(input_elem, 'getConnectedNode'):
-                            connected_node = input_elem.getConnectedNode()
-                            if connected_node:
-                                # Basic connection validation
-                                if not document.getChild(connected_node.getName()):
-                                    results['warnings'].append(f"Input '{input_elem.getName()}' on node '{node.getName()}' connects to non-existent node")
+                        connected_node = input_elem.getConnectedNode()
+                        # Basic connection validation
+                        if connected_node and connected_node.getName() not in document_child_names:
+                            results['warnings'].append(f"Input '{input_elem.getName()}' on node '{node.getName()}' connects to non-existent node")
                     except Exception as e:
-                        # Skip validation if API is not available
-                        pass
+                        # A bad port is reported on its own; keep checking the rest
+                        results['warnings'].append(f"Could not validate input '{input_elem.getName()}' on node '{node.getName()}': {str(e)}")
                         
         except Exception as e:
             results['errors'].append(f"Connection validation failed: {str(e)}")
     
-    def _validate_performance(self, document: mx.Document, results: Dict[str, Any]):
+    def _validate_performance(self, document: mx.Document, results: Dict[str, Any],
+                              nodes: Optional[List[mx.Node]] = None):
         """Validate document for performance issues."""
         try:
             # Check for excessive node count
-            nodes = document.getNodes()
+            if nodes is None:
+                nodes = document.getNodes()
             if len(nodes) > 100:
                 results['performance_issues'].append(f"Large number of nodes ({len(nodes)}) may impact performance")
             
@@ -399,7 +562,7 @@ class MaterialXAdvancedValidator:
                     results['performance_issues'].append(f"Deep nesting detected in nodegraph '{nodegraph.getName()}' (depth: {depth})")
             
             # Check for unused nodes
-            unused_nodes = self._find_unused_nodes(document)
+            unused_nodes = self._find_unused_nodes(document, nodes)
             if unused_nodes:
                 results['suggestions'].append(f"Found {len(unused_nodes)} unused nodes that could be removed")
                 
@@ -443,47 +606,44 @@ class MaterialXAdvancedValidator:
         
         return max_depth
     
-    def _find_unused_nodes(self, document: mx.Document) -> List[mx.Node]:
+    def _find_unused_nodes(self, document: mx.Document,
+                           nodes: Optional[List[mx.Node]] = None) -> List[mx.Node]:
         """Find nodes that are not connected to any material output."""
         try:
             # Get all nodes
-            all_nodes = list(document.getNodes())
+            all_nodes = list(document.getNodes()) if nodes is None else nodes
             
-            # Find nodes connected to materials
-            connected_nodes = []
+            # Find nodes connected to materials (tracked by name path, so
+            # membership tests are O(1) instead of element comparisons)
+            connected_nodes = set()
             materials = document.getMaterialNodes()
             
             for material in materials:
                 self._collect_connected_nodes(material, connected_nodes, document)
             
             # Return unused nodes (nodes not in connected_nodes)
-            unused_nodes = []
-            for node in all_nodes:
-                if node not in connected_nodes:
-                    unused_nodes.append(node)
-            
-            return unused_nodes
+            return [node for node in all_nodes if node.getNamePath() not in connected_nodes]
             
         except Exception as e:
             self.logger.error(f"Error finding unused nodes: {str(e)}")
             return []
     
-    def _collect_connected_nodes(self, element: mx.Element, connected_nodes: list, document: mx.Document):
-        """Collect all nodes connected to a given element."""
+    def _collect_connected_nodes(self, element: mx.Element, connected_nodes: set, document: mx.Document):
+        """Collect the name paths of all nodes connected to a given element."""
         if element.isA(mx.Node):
-            if element not in connected_nodes:
-                connected_nodes.append(element)
+            connected_nodes.add(element.getNamePath())
             
             # Check inputs
+            if not _HAS_CONNECTED_NODE_API:
+                return
             for input_elem in element.getInputs():
                 try:
-                    if hasattr(input_elem, 'getConnectedNode'):
-                        connected_node = input_elem.getConnectedNode()
-                        if connected_node and connected_node not in connected_nodes:
-                            self._collect_connected_nodes(connected_node, connected_nodes, document)
-                except Exception as e:
-                    # Skip if API is not available
-                    pass
+                    connected_node = input_elem.getConnectedNode()
+                except Exception:
+                    # Skip a port whose connection cannot be resolved
+                    continue
+                if connected_node and connected_node.getNamePath() not in connected_nodes:
+                    self._collect_connected_nodes(connected_node, connected_nodes, document)
     
     def _apply_custom_validators(self, document: mx.Document, results: Dict[str, Any]):
         """Apply custom validation rules."""
@@ -523,6 +683,11 @@ class MaterialXDocumentManager:
     - Performance monitoring
     """
     
+    __slots__ = ('logger', 'version', 'document', 'libraries', 'library_files', 'search_path',
+                 'performance_monitor', 'advanced_validator',
+                 '_node_def_cache', '_input_def_cache', '_output_def_cache', '_input_type_map_cache',
+                 '_node_def_records', '_node_defs_by_type')
+    
     def __init__(self, logger, version: str = "1.39"):
         self.logger = logger
         self.version = version
@@ -535,10 +700,19 @@ class MaterialXDocumentManager:
         self.performance_monitor = MaterialXPerformanceMonitor(logger)
         self.advanced_validator = MaterialXAdvancedValidator(logger)
         
-        # Cache for performance optimization
+        # Cache for performance optimization; node definitions are keyed by
+        # (node_type, category), input/output definitions by
+        # (node_type, port name, category)
         self._node_def_cache = {}
         self._input_def_cache = {}
         self._output_def_cache = {}
+        self._input_type_map_cache = {}
+        
+        # Snapshot of the document's node definitions for uncached lookups,
+        # built on first use: (nodedef, name, lowercase name, type, category)
+        # records plus a type -> records index
+        self._node_def_records = None
+        self._node_defs_by_type = None
         
     def load_libraries(self, custom_search_path: Optional[str] = None) -> bool:
         """
@@ -555,15 +729,12 @@ class MaterialXDocumentManager:
             
             self.logger.info(f"Loading MaterialX libraries (version: {self.version})")
             
-            # Create libraries document if not already created
-            if self.libraries is None:
-                self.libraries = mx.createDocument()
-            
-            # Use the working method from our debug test
+            # Use the working method from our debug test. The parsed libraries
+            # are shared across managers rather than re-read for each document.
             self.logger.info("Using MaterialX 1.39+ library loading method")
             search_path = mx.getDefaultDataSearchPath()
             lib_folders = mx.getDefaultDataLibraryFolders()
-            self.library_files = mx.loadLibraries(lib_folders, search_path, self.libraries)
+            self.libraries, self.library_files = _get_shared_libraries(lib_folders, search_path)
             
             self.logger.info(f"Loaded {len(self.library_files)} library files")
             
@@ -590,9 +761,8 @@ class MaterialXDocumentManager:
             
             self.logger.info("Creating MaterialX document")
             
-            # Create libraries document if not already created
+            # Load (or reuse the shared) libraries if not already loaded
             if self.libraries is None:
-                self.libraries = mx.createDocument()
                 if not self.load_libraries():
                     raise RuntimeError("Failed to load MaterialX libraries")
             
@@ -602,16 +772,24 @@ class MaterialXDocumentManager:
             # Set colorspace attribute (required for MaterialX compliance)
             self.document.setColorSpace("lin_rec709")
             
-            self.logger.info(f"Working document has {len(self.document.getNodeDefs())} node definitions before import")
-            self.document.importLibrary(self.libraries)
-            self.logger.info(f"Working document has {len(self.document.getNodeDefs())} node definitions after import")
-            
-            # Validate document after creation
-            validation_results = self.advanced_validator.validate_document_comprehensive(self.document)
-            if not validation_results['valid']:
-                self.logger.warning("Document validation issues detected:")
-                for error in validation_results['errors']:
-                    self.logger.warning(f"  - {error}")
+            if _HAS_DATA_LIBRARY_API:
+                self.document.setDataLibrary(self.libraries)
+                self.logger.info(f"Working document references {len(self.libraries.getNodeDefs())} node definitions from the data library")
+            else:
+                self.logger.info(f"Working document has {len(self.document.getNodeDefs())} node definitions before import")
+                self.document.importLibrary(self.libraries)
+                self.logger.info(f"Working document has {len(self.document.getNodeDefs())} node definitions after import")
+            self._node_def_records = None
+            self._node_defs_by_type = None
+            
+            # Validate document after creation. The result is only logged, so
+            # skip the pass when verbose logging is off.
+            if self.logger.isEnabledFor(logging.INFO):
+                validation_results = self.advanced_validator.validate_document_comprehensive(self.document)
+                if not validation_results['valid']:
+                    self.logger.warning("Document validation issues detected:")
+                    for error in validation_results['errors']:
+                        self.logger.warning(f"  - {error}")
             
             self.logger.info("MaterialX document created successfully")
             
@@ -638,72 +816,62 @@ class MaterialXDocumentManager:
             self.logger.error("No document available for node definition lookup")
             return None
         
-        # Create cache key
-        cache_key = f"{node_type}_{category or 'any'}"
-        
-        # Check cache first
+        # Check cache first (misses are cached as None too)
+        cache_key = (node_type, category)
         if cache_key in self._node_def_cache:
             return self._node_def_cache[cache_key]
         
         try:
             self.performance_monitor.start_operation("get_node_definition")
             
-            # Get all node definitions and search through them
-            all_node_defs = self.document.getNodeDefs()
-            print(f"DEBUG: Searching for node definition '{node_type}' (category: {category}) among {len(all_node_defs)} node definitions")
+            # Search the node definition snapshot rather than calling into
+            # MaterialX for every definition's name, type and category
+            if self._node_def_records is None:
+                self._index_node_definitions()
+            all_node_defs = self._node_def_records
             self.logger.info(f"Searching for node definition '{node_type}' (category: {category}) among {len(all_node_defs)} node definitions")
             
             # Look for exact match first by node type
-            for nodedef in all_node_defs:
-                if nodedef.getType() == node_type:
-                    if category is None or nodedef.getCategory() == category:
-                        result = nodedef
-                        self.logger.info(f"Found exact match by type: {nodedef.getName()}")
-                        break
+            for nodedef, nodedef_name, _, _, nodedef_category in self._node_defs_by_type.get(node_type, ()):
+                if category is None or nodedef_category == category:
+                    result = nodedef
+                    self.logger.info(f"Found exact match by type: {nodedef_name}")
+                    break
             else:
                 # If no exact match by type, try searching by node name
-                print(f"DEBUG: No exact match by type, trying search by name...")
                 self.logger.info(f"No exact match by type, trying search by name...")
+                node_type_lower = node_type.lower()
                 
                 # Debug: Show some node names that contain our search term
-                matching_names = []
-                for nodedef in all_node_defs:
-                    nodedef_name = nodedef.getName()
-                    if node_type.lower() in nodedef_name.lower():
-                        matching_names.append(nodedef_name)
-                
-                if matching_names:
-                    print(f"DEBUG: Found {len(matching_names)} node names containing '{node_type}': {matching_names[:5]}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    matching_names = [record[1] for record in all_node_defs if node_type_lower in record[2]]
+                    if matching_names:
+                        self.logger.debug("Found %d node names containing '%s': %s", len(matching_names), node_type, matching_names[:5])
                 
-                for nodedef in all_node_defs:
-                    nodedef_name = nodedef.getName()
+                for nodedef, nodedef_name, nodedef_name_lower, nodedef_type, nodedef_category in all_node_defs:
                     # Look for the node type in the name (e.g., "standard_surface" in "ND_standard_surface_surfaceshader")
-                    if node_type.lower() in nodedef_name.lower():
-                        nodedef_category = nodedef.getCategory()
-                        nodedef_type = nodedef.getType()
-                        print(f"DEBUG: Checking {nodedef_name} - category: {nodedef_category}, type: {nodedef_type}, expected: {category}")
+                    if node_type_lower in nodedef_name_lower:
+                        self.logger.debug("Checking %s - category: %s, type: %s, expected: %s",
+                                          nodedef_name, nodedef_category, nodedef_type, category)
                         if category is None or nodedef_type == category:
                             result = nodedef
-                            print(f"DEBUG: Found match by name: {nodedef_name} (type: {nodedef.getType()})")
-                            self.logger.info(f"Found match by name: {nodedef_name} (type: {nodedef.getType()})")
+                            self.logger.info(f"Found match by name: {nodedef_name} (type: {nodedef_type})")
                             break
                 else:
                     # If no match by name, try partial matching on type
                     self.logger.info(f"No match by name, trying partial matching on type...")
-                    for nodedef in all_node_defs:
-                        nodedef_type = nodedef.getType()
+                    for nodedef, nodedef_name, _, nodedef_type, nodedef_category in all_node_defs:
                         if node_type in nodedef_type or nodedef_type in node_type:
-                            if category is None or nodedef.getCategory() == category:
+                            if category is None or nodedef_category == category:
                                 result = nodedef
-                                self.logger.info(f"Found partial match by type: {nodedef.getName()} (type: {nodedef_type})")
+                                self.logger.info(f"Found partial match by type: {nodedef_name} (type: {nodedef_type})")
                                 break
                     else:
                         result = None
                         self.logger.warning(f"No node definition found for '{node_type}' (category: {category})")
             
-            # Cache the result
-            if result is not None:
-                self._node_def_cache[cache_key] = result
+            # Cache the result, including misses, until the libraries reload
+            self._node_def_cache[cache_key] = result
             
             self.performance_monitor.end_operation("get_node_definition")
             return result
@@ -713,6 +881,20 @@ class MaterialXDocumentManager:
             self.performance_monitor.end_operation("get_node_definition")
             return None
     
+    def _index_node_definitions(self):
+        """Snapshot the document's node definitions, indexed by type."""
+        # getNodeDefs() already includes definitions referenced through a
+        # data library (setDataLibrary), so they are not added again here
+        records = []
+        by_type = {}
+        for nodedef in self.document.getNodeDefs():
+            nodedef_name = nodedef.getName()
+            record = (nodedef, nodedef_name, nodedef_name.lower(), nodedef.getType(), nodedef.getCategory())
+            records.append(record)
+            by_type.setdefault(record[3], []).append(record)
+        self._node_def_records = records
+        self._node_defs_by_type = by_type
+    
     def get_input_definition(self, node_type: str, input_name: str, category: str = None) -> Optional[mx.Input]:
         """
         Get an input definition from a node definition.
@@ -725,10 +907,40 @@ class MaterialXDocumentManager:
         Returns:
             mx.Input: The input definition or None if not found
         """
+        cache_key = (node_type, input_name, category)
+        if cache_key in self._input_def_cache:
+            return self._input_def_cache[cache_key]
+        
+        # getActiveInput also finds inputs inherited from a base nodedef
+        # (e.g. ND_standard_surface_surfaceshader_100)
         nodedef = self.get_node_definition(node_type, category)
-        if nodedef:
-            return nodedef.getInput(input_name)
-        return None
+        input_def = nodedef.getActiveInput(input_name) if nodedef else None
+        self._input_def_cache[cache_key] = input_def
+        return input_def
+    
+    def get_input_type_map(self, node_type: str, category: str = None) -> Dict[str, str]:
+        """
+        Get the input name -> type map of a node definition.
+        
+        Args:
+            node_type: The node type
+            category: Optional category filter
+            
+        Returns:
+            Dict[str, str]: Input types by name (empty if no definition is found)
+        """
+        cache_key = (node_type, category)
+        type_map = self._input_type_map_cache.get(cache_key)
+        if type_map is None:
+            nodedef = self.get_node_definition(node_type, category)
+            # Interned so the type comparisons and dict lookups downstream hit
+            # the identity fast path
+            type_map = {
+                input_def.getName(): sys.intern(input_def.getType())
+                for input_def in nodedef.getActiveInputs()
+            } if nodedef else {}
+            self._input_type_map_cache[cache_key] = type_map
+        return type_map
     
     def get_output_definition(self, node_type: str, output_name: str, category: str = None) -> Optional[mx.Output]:
         """
@@ -742,10 +954,14 @@ class MaterialXDocumentManager:
         Returns:
             mx.Output: The output definition or None if not found
         """
+        cache_key = (node_type, output_name, category)
+        if cache_key in self._output_def_cache:
+            return self._output_def_cache[cache_key]
+        
         nodedef = self.get_node_definition(node_type, category)
-        if nodedef:
-            return nodedef.getOutput(output_name)
-        return None
+        output_def = nodedef.getActiveOutput(output_name) if nodedef else None
+        self._output_def_cache[cache_key] = output_def
+        return output_def
     
     def validate_document(self) -> bool:
         """
@@ -801,6 +1017,9 @@ class MaterialXDocumentManager:
         self._node_def_cache.clear()
         self._input_def_cache.clear()
         self._output_def_cache.clear()
+        self._input_type_map_cache.clear()
+        self._node_def_records = None
+        self._node_defs_by_type = None
         gc.collect()
     
     def get_performance_stats(self) -> Dict[str, Any]:
@@ -809,7 +1028,8 @@ class MaterialXDocumentManager:
             'cache_sizes': {
                 'node_defs': len(self._node_def_cache),
                 'input_defs': len(self._input_def_cache),
-                'output_defs': len(self._output_def_cache)
+                'output_defs': len(self._output_def_cache),
+                'input_type_maps': len(self._input_type_map_cache)
             },
             'suggestions': self.performance_monitor.suggest_optimizations()
         }
@@ -821,6 +1041,74 @@ class MaterialXDocumentManager:
         self.logger.info("MaterialXDocumentManager cleanup completed")
 
 
+def _components_to_vector2(components: List[float]) -> List[float]:
+    """Fit float components to a vector2, broadcasting a single component."""
+    if len(components) >= 2:
+        return components[:2]
+    if components:
+        return [components[0], components[0]]
+    return [0.0, 0.0]
+
+
+def _components_to_vector3(components: List[float]) -> List[float]:
+    """Fit float components to a color3/vector3, broadcasting a single component."""
+    if len(components) >= 3:
+        return components[:3]
+    if components:
+        return [components[0], components[0], components[0]]
+    return [0.0, 0.0, 0.0]
+
+
+def _components_to_color4(components: List[float]) -> List[float]:
+    """Fit float components to a color4, defaulting alpha to 1.0."""
+    if len(components) >= 4:
+        return components[:4]
+    if len(components) == 3:
+        return components + [1.0]
+    if components:
+        return [components[0], components[0], components[0], 1.0]
+    return [0.0, 0.0, 0.0, 1.0]
+
+
+def _scalar_to_vector2(value: Any) -> List[float]:
+    val = float(value)
+    return [val, val]
+
+
+def _scalar_to_vector3(value: Any) -> List[float]:
+    val = float(value)
+    return [val, val, val]
+
+
+def _scalar_to_color4(value: Any) -> List[float]:
+    val = float(value)
+    return [val, val, val, 1.0]
+
+
+# Target type -> converter for array values, already flattened to floats
+_ARRAY_VALUE_CONVERTERS = {
+    'float': lambda components: components[0] if components else 0.0,
+    'integer': lambda components: int(components[0]) if components else 0,
+    'boolean': lambda components: bool(components[0]) if components else False,
+    'color3': _components_to_vector3,
+    'vector3': _components_to_vector3,
+    'vector2': _components_to_vector2,
+    'color4': _components_to_color4,
+}
+
+# Target type -> converter for scalar (non-array) values
+_SCALAR_VALUE_CONVERTERS = {
+    'float': float,
+    'integer': int,
+    'boolean': bool,
+    'string': str,
+    'color3': _scalar_to_vector3,
+    'vector3': _scalar_to_vector3,
+    'vector2': _scalar_to_vector2,
+    'color4': _scalar_to_color4,
+}
+
+
 class MaterialXTypeConverter:
     """
     Handles type conversion and validation for MaterialX inputs and outputs.
@@ -831,34 +1119,55 @@ class MaterialXTypeConverter:
     - Value formatting for different MaterialX types
     """
     
+    # Type compatibility mapping (shared by all converters)
+    type_compatibility = {
+        'color3': ['color3', 'vector3'],
+        'vector3': ['vector3', 'color3'],
+        'vector2': ['vector2'],
+        'vector4': ['vector4', 'color4'],
+        'color4': ['color4', 'vector4'],
+        'float': ['float'],
+        'filename': ['filename'],
+        'string': ['string'],
+        'integer': ['integer'],
+        'boolean': ['boolean']
+    }
+    
+    # The same mapping flattened to (from_type, to_type) pairs, so a
+    # compatibility check is a single set membership test
+    compatible_type_pairs = frozenset(
+        (from_type, to_type)
+        for from_type, to_types in type_compatibility.items()
+        for to_type in to_types
+    )
+    
+    # Blender to MaterialX type mapping
+    blender_to_mtlx_types = {
+        'RGBA': 'color4',
+        'RGB': 'color3',
+        'VECTOR': 'vector3',
+        'VECTOR_2D': 'vector2',
+        'VALUE': 'float',
+        'INT': 'integer',
+        'BOOLEAN': 'boolean',
+        'STRING': 'string'
+    }
+    
+    # Safe defaults returned when a value cannot be converted to a type
+    fallback_values = {
+        'float': 0.0,
+        'integer': 0,
+        'boolean': False,
+        'color3': (0.0, 0.0, 0.0),
+        'vector3': (0.0, 0.0, 0.0),
+        'vector2': (0.0, 0.0),
+        'color4': (0.0, 0.0, 0.0, 1.0),
+    }
+    
+    __slots__ = ('logger',)
+    
     def __init__(self, logger):
         self.logger = logger
-        
-        # Type compatibility mapping
-        self.type_compatibility = {
-            'color3': ['color3', 'vector3'],
-            'vector3': ['vector3', 'color3'],
-            'vector2': ['vector2'],
-            'vector4': ['vector4', 'color4'],
-            'color4': ['color4', 'vector4'],
-            'float': ['float'],
-            'filename': ['filename'],
-            'string': ['string'],
-            'integer': ['integer'],
-            'boolean': ['boolean']
-        }
-        
-        # Blender to MaterialX type mapping
-        self.blender_to_mtlx_types = {
-            'RGBA': 'color4',
-            'RGB': 'color3',
-            'VECTOR': 'vector3',
-            'VECTOR_2D': 'vector2',
-            'VALUE': 'float',
-            'INT': 'integer',
-            'BOOLEAN': 'boolean',
-            'STRING': 'string'
-        }
     
     def convert_blender_type(self, blender_type: str) -> str:
         """
@@ -883,24 +1192,9 @@ class MaterialXTypeConverter:
         Returns:
             bool: True if conversion is compatible
         """
-        # Direct match
-        if from_type == to_type:
-            return True
-        
-        # Check compatibility mapping
-        if from_type in self.type_compatibility:
-            compatible_types = self.type_compatibility[from_type]
-            if to_type in compatible_types:
-                return True
-        
-        # Special cases
-        if from_type == 'color3' and to_type == 'vector3':
-            return True
-        if from_type == 'vector3' and to_type == 'color3':
-            return True
-        if from_type == 'color4' and to_type == 'vector4':
-            return True
-        if from_type == 'vector4' and to_type == 'color4':
+        # Direct match, or a pair listed in the compatibility mapping (which
+        # covers the color/vector conversions)
+        if from_type == to_type or (from_type, to_type) in self.compatible_type_pairs:
             return True
         
         self.logger.warning(f"Type incompatibility: {from_type} -> {to_type}")
@@ -918,155 +1212,67 @@ class MaterialXTypeConverter:
             Any: The converted value
         """
         try:
+            # Plain numbers (the common case) skip the sequence check; anything
+            # else is treated as an array if it supports len()
+            is_array = False
+            if not isinstance(value, (int, float, str, bytes)):
+                try:
+                    len(value)
+                    is_array = True
+                except TypeError:
+                    pass
+            
             # Handle Blender's bpy_prop_array types
-            if hasattr(value, '__len__') and not isinstance(value, (str, bytes)):
+            if is_array:
                 # Convert Blender arrays to list of floats
                 try:
                     if hasattr(value, 'default_value'):
                         # Handle Blender socket default values
                         value = value.default_value
                     
-                    # Convert to list of floats
-                    float_list = []
-                    for i in range(len(value)):
-                        try:
-                            float_list.append(float(value[i]))
-                        except (TypeError, ValueError, IndexError):
-                            float_list.append(0.0)
+                    # Convert to list of floats in one pass; only fall back to
+                    # per-element conversion if some component is not numeric
+                    try:
+                        float_list = list(map(float, value[:]))
+                    except (TypeError, ValueError):
+                        float_list = []
+                        for i in range(len(value)):
+                            try:
+                                float_list.append(float(value[i]))
+                            except (TypeError, ValueError, IndexError):
+                                float_list.append(0.0)
                     
                     # Now handle based on target type
-                    if target_type == 'float':
-                        return float_list[0] if float_list else 0.0
-                    elif target_type == 'integer':
-                        return int(float_list[0]) if float_list else 0
-                    elif target_type == 'boolean':
-                        return bool(float_list[0]) if float_list else False
-                    elif target_type == 'string':
+                    if target_type == 'string':
                         return str(value)
-                    elif target_type == 'color3':
-                        if len(float_list) >= 3:
-                            return [float_list[0], float_list[1], float_list[2]]
-                        elif len(float_list) >= 1:
-                            return [float_list[0], float_list[0], float_list[0]]
-                        else:
-                            return [0.0, 0.0, 0.0]
-                    elif target_type == 'vector3':
-                        if len(float_list) >= 3:
-                            return [float_list[0], float_list[1], float_list[2]]
-                        elif len(float_list) >= 1:
-                            return [float_list[0], float_list[0], float_list[0]]
-                        else:
-                            return [0.0, 0.0, 0.0]
-                    elif target_type == 'vector2':
-                        if len(float_list) >= 2:
-                            return [float_list[0], float_list[1]]
-                        elif len(float_list) >= 1:
-                            return [float_list[0], float_list[0]]
-                        else:
-                            return [0.0, 0.0]
-                    elif target_type == 'color4':
-                        if len(float_list) >= 4:
-                            return [float_list[0], float_list[1], float_list[2], float_list[3]]
-                        elif len(float_list) >= 3:
-                            return [float_list[0], float_list[1], float_list[2], 1.0]
-                        elif len(float_list) >= 1:
-                            return [float_list[0], float_list[0], float_list[0], 1.0]
-                        else:
-                            return [0.0, 0.0, 0.0, 1.0]
-                    
-                    return float_list
+                    converter = _ARRAY_VALUE_CONVERTERS.get(target_type)
+                    return converter(float_list) if converter is not None else float_list
                     
                 except Exception as e:
                     self.logger.error(f"Error converting Blender array {value} to type {target_type}: {str(e)}")
                     # Fallback to default values
-                    if target_type == 'float':
-                        return 0.0
-                    elif target_type == 'integer':
-                        return 0
-                    elif target_type == 'boolean':
-                        return False
-                    elif target_type == 'string':
-                        return str(value)
-                    elif target_type == 'color3':
-                        return [0.0, 0.0, 0.0]
-                    elif target_type == 'vector3':
-                        return [0.0, 0.0, 0.0]
-                    elif target_type == 'vector2':
-                        return [0.0, 0.0]
-                    elif target_type == 'color4':
-                        return [0.0, 0.0, 0.0, 1.0]
-                    return value
+                    return self._fallback_value(value, target_type)
             
             # Handle regular types (non-array)
-            if target_type == 'float':
-                return float(value)
-            elif target_type == 'integer':
-                return int(value)
-            elif target_type == 'boolean':
-                return bool(value)
-            elif target_type == 'string':
-                return str(value)
-            elif target_type == 'color3':
-                if isinstance(value, (list, tuple)):
-                    if len(value) >= 3:
-                        return [float(value[0]), float(value[1]), float(value[2])]
-                    elif len(value) == 1:
-                        return [float(value[0]), float(value[0]), float(value[0])]
-                else:
-                    val = float(value)
-                    return [val, val, val]
-            elif target_type == 'vector3':
-                if isinstance(value, (list, tuple)):
-                    if len(value) >= 3:
-                        return [float(value[0]), float(value[1]), float(value[2])]
-                    elif len(value) == 1:
-                        return [float(value[0]), float(value[0]), float(value[0])]
-                else:
-                    val = float(value)
-                    return [val, val, val]
-            elif target_type == 'vector2':
-                if isinstance(value, (list, tuple)):
-                    if len(value) >= 2:
-                        return [float(value[0]), float(value[1])]
-                    elif len(value) == 1:
-                        return [float(value[0]), float(value[0])]
-                else:
-                    val = float(value)
-                    return [val, val]
-            elif target_type == 'color4':
-                if isinstance(value, (list, tuple)):
-                    if len(value) >= 4:
-                        return [float(value[0]), float(value[1]), float(value[2]), float(value[3])]
-                    elif len(value) >= 3:
-                        return [float(value[0]), float(value[1]), float(value[2]), 1.0]
-                    elif len(value) == 1:
-                        return [float(value[0]), float(value[0]), float(value[0]), 1.0]
-                else:
-                    val = float(value)
-                    return [val, val, val, 1.0]
+            converter = _SCALAR_VALUE_CONVERTERS.get(target_type)
+            if converter is not None:
+                return converter(value)
             
             return value
             
         except Exception as e:
             self.logger.error(f"Error converting value {value} to type {target_type}: {str(e)}")
             # Return safe defaults
-            if target_type == 'float':
-                return 0.0
-            elif target_type == 'integer':
-                return 0
-            elif target_type == 'boolean':
-                return False
-            elif target_type == 'string':
-                return str(value)
-            elif target_type == 'color3':
-                return [0.0, 0.0, 0.0]
-            elif target_type == 'vector3':
-                return [0.0, 0.0, 0.0]
-            elif target_type == 'vector2':
-                return [0.0, 0.0]
-            elif target_type == 'color4':
-                return [0.0, 0.0, 0.0, 1.0]
+            return self._fallback_value(value, target_type)
+    
+    def _fallback_value(self, value: Any, target_type: str) -> Any:
+        """Return the safe default used when a value cannot be converted."""
+        if target_type == 'string':
+            return str(value)
+        default = self.fallback_values.get(target_type)
+        if default is None:
             return value
+        return list(default) if isinstance(default, tuple) else default
     
     def format_value_string(self, value: Any, value_type: str) -> str:
         """
@@ -1084,14 +1290,12 @@ class MaterialXTypeConverter:
                 return f"{value:.4g}"
             elif isinstance(value, (list, tuple)):
                 # Handle vector/color types
-                if value_type in ['color3', 'vector3'] and len(value) >= 3:
-                    return f"{value[0]:.4g},{value[1]:.4g},{value[2]:.4g}"
-                elif value_type in ['color4', 'vector4'] and len(value) >= 4:
-                    return f"{value[0]:.4g},{value[1]:.4g},{value[2]:.4g},{value[3]:.4g}"
-                elif value_type in ['vector2'] and len(value) >= 2:
-                    return f"{value[0]:.4g},{value[1]:.4g}"
-                else:
-                    return ",".join(f"{v:.4g}" for v in value)
+                vector_format = _VECTOR_VALUE_FORMATS.get(value_type)
+                if vector_format is not None:
+                    component_count, format_components = vector_format
+                    if len(value) >= component_count:
+                        return format_components(*value[:component_count])
+                return ",".join(map(_format_float, value))
             else:
                 return str(value)
                 
@@ -1112,12 +1316,83 @@ class MaterialXNodeBuilder:
     - Nodegraph creation and management
     """
     
+    __slots__ = ('doc_manager', 'logger', 'node_counter', 'created_nodes', 'type_converter',
+                 '_value_string_cache', '_default_string_cache', '_default_skip_cache',
+                 '_name_counters', '_child_names')
+    
     def __init__(self, document_manager: MaterialXDocumentManager, logger):
         self.doc_manager = document_manager
         self.logger = logger
         self.node_counter = 0
         self.created_nodes = {}
         self.type_converter = MaterialXTypeConverter(logger)
+        # (value, input type) -> formatted MaterialX value string
+        self._value_string_cache = {}
+        # (node type, category, input name) -> nodedef default value string,
+        # formatted like our own values (None if the nodedef declares none)
+        self._default_string_cache = {}
+        # (node type, category, input name, value) -> whether skip_default
+        # leaves that constant out
+        self._default_skip_cache = {}
+        # (parent name path, name prefix) -> next numeric suffix to try
+        self._name_counters = {}
+        # parent name path -> names of all its children, for parents created
+        # by this builder (whose children all get their names from here)
+        self._child_names = {}
+    
+    def _create_unique_child_name(self, parent: mx.Element, name: str) -> str:
+        """
+        Create a valid, unique child name under parent.
+        
+        Produces the same names as parent.createValidChildName(), but keeps a
+        per-parent counter for each name prefix so that repeated names resume
+        from the last suffix instead of probing from 2 every time.
+        
+        For parents created by this builder the child names are tracked in a
+        set, so uniqueness is checked without calling into MaterialX.
+        """
+        valid_name = _sanitize_name(name)
+        parent_path = parent.getNamePath()
+        child_names = self._child_names.get(parent_path)
+        is_taken = parent.getChild if child_names is None else child_names.__contains__
+        
+        counter = self._name_counters.get((parent_path, valid_name))
+        if counter is None:
+            if not is_taken(valid_name):
+                self._name_counters[(parent_path, valid_name)] = 0
+                if child_names is not None:
+                    child_names.add(valid_name)
+                return valid_name
+            counter = 0
+        
+        # Same suffix scheme as MaterialX incrementName()
+        prefix = valid_name.rstrip('0123456789')
+        suffix = valid_name[len(prefix):]
+        counter = max(counter, int(suffix) + 1 if suffix else 2)
+        
+        candidate = f"{prefix}{counter}"
+        while is_taken(candidate):
+            counter += 1
+            candidate = f"{prefix}{counter}"
+        self._name_counters[(parent_path, valid_name)] = counter + 1
+        if child_names is not None:
+            child_names.add(candidate)
+        return candidate
+    
+    def remove_child(self, parent: mx.Element, name: str):
+        """
+        Remove a child element and forget its name.
+        
+        The parent's name counters are reset, so later names probe from the
+        lowest free suffix again, as createValidChildName() would.
+        """
+        parent.removeChild(name)
+        parent_path = parent.getNamePath()
+        child_names = self._child_names.get(parent_path)
+        if child_names is not None:
+            child_names.discard(name)
+        for key in [key for key in self._name_counters if key[0] == parent_path]:
+            del self._name_counters[key]
         
     def add_node(self, node_type: str, name: str, category: str = None, 
                  parent: mx.Element = None) -> Optional[mx.Node]:
@@ -1143,7 +1418,7 @@ class MaterialXNodeBuilder:
                 self.node_counter += 1
             
             # Create valid child name
-            valid_name = parent.createValidChildName(name)
+            valid_name = self._create_unique_child_name(parent, name)
             
             # Get node definition
             if category:
@@ -1160,7 +1435,7 @@ class MaterialXNodeBuilder:
             
             if node:
                 self.created_nodes[valid_name] = node
-                self.logger.debug(f"Created node: {valid_name} (type: {node_type})")
+                self.logger.debug("Created node: %s (type: %s)", valid_name, node_type)
             
             return node
             
@@ -1183,12 +1458,14 @@ class MaterialXNodeBuilder:
             if not parent:
                 parent = self.doc_manager.document
             
-            valid_name = parent.createValidChildName(name)
+            valid_name = self._create_unique_child_name(parent, name)
             nodegraph = parent.addChildOfCategory('nodegraph', valid_name)
             
             if nodegraph:
                 self.created_nodes[valid_name] = nodegraph
-                self.logger.debug(f"Created nodegraph: {valid_name}")
+                # New and empty: every child name is assigned by this builder
+                self._child_names[nodegraph.getNamePath()] = set()
+                self.logger.debug("Created nodegraph: %s", valid_name)
             
             return nodegraph
             
@@ -1196,8 +1473,66 @@ class MaterialXNodeBuilder:
             self.logger.error(f"Failed to create nodegraph {name}: {str(e)}")
             return None
     
+    def _format_input_value(self, value: Any, input_type: str) -> str:
+        """
+        Convert and format a constant input value, memoized per (value, type).
+        
+        Materials repeat the same handful of defaults (white colors, zero
+        vectors, 0.5 roughness), so most inputs reuse an already formatted
+        string instead of converting and formatting again.
+        """
+        # Strings for string-typed inputs (e.g. texture file paths) are already
+        # MaterialX value strings; conversion and formatting are identities.
+        # Other values for these inputs are formatted with str() and are not
+        # cached: 1, 1.0 and True share a cache key but format differently.
+        if input_type in _STRING_VALUE_TYPES:
+            if isinstance(value, str):
+                return value
+            converted_value = self.type_converter.convert_value(value, input_type)
+            return self.type_converter.format_value_string(converted_value, input_type)
+        
+        value_key = tuple(value) if isinstance(value, list) else value
+        try:
+            return self._value_string_cache[(value_key, input_type)]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable values (e.g. Blender property arrays) are not cached
+            converted_value = self.type_converter.convert_value(value, input_type)
+            return self.type_converter.format_value_string(converted_value, input_type)
+        
+        converted_value = self.type_converter.convert_value(value, input_type)
+        formatted_value = self.type_converter.format_value_string(converted_value, input_type)
+        self._value_string_cache[(value_key, input_type)] = formatted_value
+        return formatted_value
+    
+    def _get_default_value_string(self, input_def: mx.Input, input_type: str, cache_key) -> Optional[str]:
+        """
+        Return the nodedef default of an input, formatted like our own values.
+        
+        Nodedef value strings are normalized through _format_input_value, so
+        '1.0' and '1' compare equal. Results are memoized per cache_key.
+        """
+        try:
+            return self._default_string_cache[cache_key]
+        except KeyError:
+            pass
+        
+        default_string = None
+        value_string = input_def.getValueString()
+        if value_string and input_type not in _STRING_VALUE_TYPES:
+            try:
+                components = [float(component) for component in value_string.split(',')]
+                default_value = components[0] if len(components) == 1 else components
+                default_string = self._format_input_value(default_value, input_type)
+            except ValueError:
+                default_string = None
+        self._default_string_cache[cache_key] = default_string
+        return default_string
+    
     def create_mtlx_input(self, node: mx.Node, input_name: str, value: Any = None, 
-                         nodename: str = None, node_type: str = None, category: str = None) -> Optional[mx.Input]:
+                         nodename: str = None, node_type: str = None, category: str = None,
+                         skip_default: bool = False) -> Optional[mx.Input]:
         """
         Create a MaterialX input with type-safe handling.
         
@@ -1208,22 +1543,49 @@ class MaterialXNodeBuilder:
             nodename: The connected node name (for connections)
             node_type: The node type for definition lookup
             category: The node category for definition lookup
+            skip_default: Don't create constant inputs whose value equals the
+                nodedef default, which the node inherits anyway
             
         Returns:
-            mx.Input: The created input or None if failed
+            mx.Input: The created input, or None if failed or skipped
         """
         try:
-            # Get input definition for type information
-            input_def = None
+            # Constants already known to equal the nodedef default need no
+            # definition lookup or formatting at all
+            skip_key = None
+            if skip_default and value is not None and node_type:
+                skip_key = (node_type, category, input_name,
+                            tuple(value) if isinstance(value, list) else value)
+                try:
+                    if self._default_skip_cache[skip_key]:
+                        return None
+                except KeyError:
+                    pass
+                except TypeError:
+                    skip_key = None  # Unhashable value, decided uncached below
+            
+            # Determine input type from the nodedef's (interned) input type map
+            input_type = None
             if node_type:
+                input_type = self.doc_manager.get_input_type_map(node_type, category).get(input_name)
+            if input_type is None:
+                # Fallback type determination
+                input_type = self._get_input_type_from_name(input_name)
+            
+            # The input definition itself is only needed for its default value
+            input_def = None
+            if skip_default and node_type and value is not None:
                 input_def = self.doc_manager.get_input_definition(node_type, input_name, category)
             
-            # Determine input type
             if input_def:
-                input_type = input_def.getType()
-            else:
-                # Fallback type determination
-                input_type = self._get_input_type_from_name(input_name)
+                default_string = self._get_default_value_string(
+                    input_def, input_type, (node_type, category, input_name))
+                is_default = (default_string is not None
+                              and default_string == self._format_input_value(value, input_type))
+                if skip_key is not None:
+                    self._default_skip_cache[skip_key] = is_default
+                if is_default:
+                    return None
             
             # Create input
             input_elem = node.addInput(input_name, input_type)
@@ -1231,14 +1593,13 @@ class MaterialXNodeBuilder:
             if input_elem:
                 if value is not None:
                     # Convert and set constant value
-                    converted_value = self.type_converter.convert_value(value, input_type)
-                    formatted_value = self.type_converter.format_value_string(converted_value, input_type)
+                    formatted_value = self._format_input_value(value, input_type)
                     input_elem.setValueString(formatted_value)
-                    self.logger.debug(f"Set input {input_name} = {formatted_value} (type: {input_type})")
+                    self.logger.debug("Set input %s = %s (type: %s)", input_name, formatted_value, input_type)
                 elif nodename:
                     # Set connection
                     input_elem.setNodeName(nodename)
-                    self.logger.debug(f"Connected input {input_name} to {nodename}")
+                    self.logger.debug("Connected input %s to %s", input_name, nodename)
             
             return input_elem
             
@@ -1278,12 +1639,12 @@ class MaterialXNodeBuilder:
             mx.Output: The created output or None if failed
         """
         try:
-            valid_name = nodegraph.createValidChildName(name)
+            valid_name = self._create_unique_child_name(nodegraph, name)
             output = nodegraph.addOutput(valid_name, output_type)
             
             if output:
                 output.setNodeName(nodename)
-                self.logger.debug(f"Added output {valid_name} connected to {nodename}")
+                self.logger.debug("Added output %s connected to %s", valid_name, nodename)
             
             return output
             
@@ -1311,9 +1672,11 @@ class MaterialXNodeBuilder:
                 self.logger.warning(f"Invalid nodes for connection: {from_node} -> {to_node}")
                 return False
             
-            # Get output and input definitions for type checking (handle None gracefully)
-            from_output_def = from_node.getActiveOutput(from_output) if from_node else None
-            to_input_def = to_node.getActiveInput(to_input) if to_node else None
+            # Get output and input definitions for type checking. The target
+            # input is looked up once and reused as the port below; on freshly
+            # created nodes it usually does not exist yet.
+            from_output_def = from_node.getActiveOutput(from_output)
+            to_input_def = to_node.getInput(to_input)
             
             # Type validation (only if definitions exist)
             if from_output_def and to_input_def:
@@ -1326,18 +1689,20 @@ class MaterialXNodeBuilder:
                         self.logger.warning(f"Type mismatch in connection: {from_type} -> {to_type}")
                         # Don't return False here, try the connection anyway
                 except Exception as type_error:
-                    self.logger.debug(f"Type validation failed, proceeding with connection: {type_error}")
+                    self.logger.debug("Type validation failed, proceeding with connection: %s", type_error)
             
             # Use direct MaterialX connection method
             try:
                 # Debug: Check what inputs are available on the target node
-                node_def = to_node.getNodeDef()
-                if node_def:
-                    available_inputs = [input.getName() for input in node_def.getInputs()]
-                    self.logger.debug(f"Available inputs for {to_node.getName()} ({to_node.getType()}): {available_inputs}")
+                # (resolving the nodedef is costly, so only when it will be logged)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    node_def = to_node.getNodeDef()
+                    if node_def:
+                        available_inputs = [input.getName() for input in node_def.getInputs()]
+                        self.logger.debug(f"Available inputs for {to_node.getName()} ({to_node.getType()}): {available_inputs}")
                 
                 # Create input if it doesn't exist
-                input_port = to_node.addInputFromNodeDef(to_input)
+                input_port = to_input_def if to_input_def else to_node.addInputFromNodeDef(to_input)
                 if input_port:
                     # Remove any existing value
                     input_port.removeAttribute('value')
@@ -1346,7 +1711,6 @@ class MaterialXNodeBuilder:
                     if from_output and from_output != 'out':
                         input_port.setOutputString(from_output)
                     success = True
-                    self.logger.debug(f"Direct connection successful: {from_node.getName()}.{from_output} -> {to_node.getName()}.{to_input}")
                 else:
                     self.logger.warning(f"Failed to create input port: {to_node.getName()}.{to_input}")
                     success = False
@@ -1355,7 +1719,10 @@ class MaterialXNodeBuilder:
                 success = False
             
             if success:
-                self.logger.debug(f"Connected {from_node.getName()}.{from_output} -> {to_node.getName()}.{to_input}")
+                # The node names are C++ calls, so only fetch them when logged
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Connected %s.%s -> %s.%s",
+                                      from_node.getName(), from_output, to_node.getName(), to_input)
             else:
                 self.logger.warning(f"Failed to connect {from_node.getName()}.{from_output} -> {to_node.getName()}.{to_input}")
             
@@ -1375,65 +1742,7 @@ class MaterialXNodeBuilder:
         Returns:
             str: The expected input type
         """
-        # Common input type mappings
-        type_mapping = {
-            'texcoord': 'vector2',
-            'in': 'color3',
-            'in1': 'color3',
-            'in2': 'color3',
-            'a': 'color3',
-            'b': 'color3',
-            'factor': 'float',
-            'scale': 'float',
-            'strength': 'float',
-            'amount': 'float',
-            'pivot': 'vector2',
-            'translate': 'vector2',
-            'rotate': 'float',
-            'file': 'filename',
-            'default': 'color3',
-            'surfaceshader': 'surfaceshader',
-            'normal': 'vector3',
-            'tangent': 'vector3',
-            
-            # Standard surface specific mappings
-            'base': 'float',
-            'base_color': 'color3',
-            'metalness': 'float',
-            'specular': 'float',
-            'specular_color': 'color3',
-            'specular_roughness': 'float',
-            'specular_ior': 'float',
-            'transmission': 'float',
-            'transmission_color': 'color3',
-            'transmission_depth': 'float',
-            'transmission_scatter': 'color3',
-            'transmission_scatter_anisotropy': 'float',
-            'transmission_dispersion': 'float',
-            'transmission_extra_roughness': 'float',
-            'opacity': 'color3',
-            'emission': 'float',
-            'emission_color': 'color3',
-            'subsurface': 'float',
-            'subsurface_color': 'color3',
-            'subsurface_radius': 'color3',
-            'subsurface_scale': 'float',
-            'subsurface_anisotropy': 'float',
-            'sheen': 'float',
-            'sheen_color': 'color3',
-            'sheen_tint': 'float',
-            'sheen_roughness': 'float',
-            'coat': 'float',
-            'coat_color': 'color3',
-            'coat_roughness': 'float',
-            'coat_ior': 'float',
-            'coat_normal': 'vector3',
-            'anisotropic': 'float',
-            'anisotropic_rotation': 'float',
-            'anisotropic_direction': 'vector3',
-        }
-        
-        return type_mapping.get(input_name.lower(), 'color3')
+        return _input_type_from_name(input_name)
 
 
 class MaterialXConnectionManager:
@@ -1447,17 +1756,31 @@ class MaterialXConnectionManager:
     - Connection optimization
     """
     
+    # Connection type compatibility mapping (shared by all managers)
+    type_mapping = {
+        'color3': ['color3', 'vector3'],
+        'vector3': ['vector3', 'color3'],
+        'vector2': ['vector2'],
+        'float': ['float'],
+        'filename': ['filename'],
+        'string': ['string']
+    }
+    
+    # The same mapping flattened to (from_type, to_type) pairs
+    compatible_type_pairs = frozenset(
+        (from_type, to_type)
+        for from_type, to_types in type_mapping.items()
+        for to_type in to_types
+    )
+    
+    __slots__ = ('logger', 'connections', '_connection_counts')
+    
     def __init__(self, logger):
         self.logger = logger
         self.connections = []
-        self.type_mapping = {
-            'color3': ['color3', 'vector3'],
-            'vector3': ['vector3', 'color3'],
-            'vector2': ['vector2'],
-            'float': ['float'],
-            'filename': ['filename'],
-            'string': ['string']
-        }
+        # Number of recorded connections touching each node, kept in step
+        # with record_connection
+        self._connection_counts = defaultdict(int)
     
     def validate_connection(self, from_type: str, to_type: str) -> bool:
         """
@@ -1470,20 +1793,9 @@ class MaterialXConnectionManager:
         Returns:
             bool: True if connection is valid
         """
-        # Direct type match
-        if from_type == to_type:
-            return True
-        
-        # Check type compatibility
-        if from_type in self.type_mapping:
-            compatible_types = self.type_mapping[from_type]
-            if to_type in compatible_types:
-                return True
-        
-        # Special cases
-        if from_type == 'color3' and to_type == 'vector3':
-            return True
-        if from_type == 'vector3' and to_type == 'color3':
+        # Direct type match, or a pair listed in the compatibility mapping
+        # (which covers color3 <-> vector3)
+        if from_type == to_type or (from_type, to_type) in self.compatible_type_pairs:
             return True
         
         self.logger.warning(f"Type mismatch: {from_type} -> {to_type}")
@@ -1500,64 +1812,7 @@ class MaterialXConnectionManager:
         Returns:
             str: The expected input type
         """
-        # Common input type mappings
-        type_mapping = {
-            'texcoord': 'vector2',
-            'in': 'color3',
-            'in1': 'color3',
-            'in2': 'color3',
-            'a': 'color3',
-            'b': 'color3',
-            'factor': 'float',
-            'scale': 'float',
-            'strength': 'float',
-            'amount': 'float',
-            'pivot': 'vector2',
-            'translate': 'vector2',
-            'rotate': 'float',
-            'file': 'filename',
-            'default': 'color3',
-            'normal': 'vector3',
-            'tangent': 'vector3',
-            
-            # Standard surface specific mappings
-            'base': 'float',
-            'base_color': 'color3',
-            'metalness': 'float',
-            'specular': 'float',
-            'specular_color': 'color3',
-            'specular_roughness': 'float',
-            'specular_ior': 'float',
-            'transmission': 'float',
-            'transmission_color': 'color3',
-            'transmission_depth': 'float',
-            'transmission_scatter': 'color3',
-            'transmission_scatter_anisotropy': 'float',
-            'transmission_dispersion': 'float',
-            'transmission_extra_roughness': 'float',
-            'opacity': 'color3',
-            'emission': 'float',
-            'emission_color': 'color3',
-            'subsurface': 'float',
-            'subsurface_color': 'color3',
-            'subsurface_radius': 'color3',
-            'subsurface_scale': 'float',
-            'subsurface_anisotropy': 'float',
-            'sheen': 'float',
-            'sheen_color': 'color3',
-            'sheen_tint': 'float',
-            'sheen_roughness': 'float',
-            'coat': 'float',
-            'coat_color': 'color3',
-            'coat_roughness': 'float',
-            'coat_ior': 'float',
-            'coat_normal': 'vector3',
-            'anisotropic': 'float',
-            'anisotropic_rotation': 'float',
-            'anisotropic_direction': 'vector3',
-        }
-        
-        return type_mapping.get(input_name.lower(), 'color3')
+        return _input_type_from_name(input_name)
     
     def record_connection(self, from_node: str, from_output: str, 
                          to_node: str, to_input: str):
@@ -1577,6 +1832,9 @@ class MaterialXConnectionManager:
             'to_input': to_input
         }
         self.connections.append(connection)
+        self._connection_counts[from_node] += 1
+        if to_node != from_node:
+            self._connection_counts[to_node] += 1
     
     def get_connection_count(self, node_name: str) -> int:
         """
@@ -1588,11 +1846,7 @@ class MaterialXConnectionManager:
         Returns:
             int: The number of connections
         """
-        count = 0
-        for conn in self.connections:
-            if conn['from_node'] == node_name or conn['to_node'] == node_name:
-                count += 1
-        return count
+        return self._connection_counts.get(node_name, 0)
 
 
 class MaterialXLibraryBuilder:
@@ -1634,8 +1888,7 @@ class MaterialXLibraryBuilder:
         self.write_options = {
             'skip_library_elements': True,
             'write_xinclude': False,
-            'remove_layout': True,
-            'format_output': True
+            'remove_layout': True
         }
         
     def add_node(self, node_type: str, name: str, node_type_category: str = None, **params) -> str:
@@ -1802,12 +2055,7 @@ class MaterialXLibraryBuilder:
         if isinstance(value, (int, float)):
             return "float"
         elif isinstance(value, (list, tuple)):
-            if len(value) == 2:
-                return "vector2"
-            elif len(value) == 3:
-                return "color3"
-            elif len(value) == 4:
-                return "color4"
+            return _SEQUENCE_PARAM_TYPES.get(len(value), "string")
         return "string"
     
     def to_string(self) -> str:
@@ -1827,18 +2075,10 @@ class MaterialXLibraryBuilder:
             # Use custom predicate for library elements
             predicate = mxf.MtlxFile.skipLibraryElement if self.write_options['skip_library_elements'] else None
             
-            # Use mtlxutils for writing with advanced options
+            # Use mtlxutils for writing with advanced options. The MaterialX
+            # writer already emits indented XML, as write_to_file does.
             content = mxf.MtlxFile.writeDocumentToString(self.document, predicate)
             
-            # Format output if requested
-            if self.write_options['format_output']:
-                try:
-                    import xml.dom.minidom
-                    dom = xml.dom.minidom.parseString(content)
-                    content = dom.toprettyxml(indent="  ")
-                except Exception as format_error:
-                    self.logger.warning(f"Failed to format XML output: {str(format_error)}")
-            
             self.performance_monitor.end_operation("to_string")
             return content
             
@@ -1847,12 +2087,14 @@ class MaterialXLibraryBuilder:
             self.performance_monitor.end_operation("to_string")
             return ""
     
-    def write_to_file(self, filepath: str) -> bool:
+    def write_to_file(self, filepath: str, validate: bool = True) -> bool:
         """
         Write the document to a file with advanced options and validation.
         
         Args:
             filepath: The output file path
+            validate: Validate the in-memory document before writing. Callers
+                that have just run validate() can pass False.
             
         Returns:
             bool: True if successful
@@ -1861,11 +2103,12 @@ class MaterialXLibraryBuilder:
             self.performance_monitor.start_operation("write_to_file")
             
             # Validate document before writing
-            validation_results = self.advanced_validator.validate_document_comprehensive(self.document)
-            if not validation_results['valid']:
-                self.logger.warning("Writing document with validation issues:")
-                for error in validation_results['errors']:
-                    self.logger.warning(f"  - {error}")
+            if validate:
+                validation_results = self.advanced_validator.validate_document_comprehensive(self.document)
+                if not validation_results['valid']:
+                    self.logger.warning("Writing document with validation issues:")
+                    for error in validation_results['errors']:
+                        self.logger.warning(f"  - {error}")
             
             # Apply advanced write options
             if self.write_options['remove_layout']:
@@ -1938,17 +2181,18 @@ class MaterialXLibraryBuilder:
                 self.logger.info(f"Removing {len(unused_nodes)} unused nodes")
                 for node in unused_nodes:
                     try:
-                        node.getParent().removeChild(node.getName())
+                        self.node_builder.remove_child(node.getParent(), node.getName())
                     except Exception as e:
                         self.logger.warning(f"Failed to remove unused node {node.getName()}: {str(e)}")
             
             # Clear caches to free memory
             self.doc_manager._clear_caches()
             
-            # Validate after optimization
-            validation_results = self.advanced_validator.validate_document_comprehensive(self.document)
-            if not validation_results['valid']:
-                self.logger.warning("Document has validation issues after optimization")
+            # Validate after optimization (diagnostic only, see create_document)
+            if self.logger.isEnabledFor(logging.INFO):
+                validation_results = self.advanced_validator.validate_document_comprehensive(self.document)
+                if not validation_results['valid']:
+                    self.logger.warning("Document has validation issues after optimization")
             
             self.logger.info("Document optimization completed")
             
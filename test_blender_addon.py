@@ -425,6 +425,53 @@ else:
         logger.error(f"Output: {result}")
         return False
 
+def import_exporter_module():
+    """Import the exporter module directly (needs MaterialX, not Blender)."""
+    addon_dir = str(Path(__file__).resolve().parent / "materialx_addon")
+    if addon_dir not in sys.path:
+        sys.path.insert(0, addon_dir)
+    import blender_materialx_exporter
+    return blender_materialx_exporter
+
+def test_materialx_builder_construction():
+    """Test that MaterialXBuilder can be constructed (runs without Blender)."""
+    logger = logging.getLogger('BlenderAddonTest')
+    logger.info("Testing MaterialXBuilder construction...")
+    
+    exporter = import_exporter_module()
+    builder = exporter.MaterialXBuilder("BuilderTest", logger)
+    assert builder.document is not None, "MaterialXBuilder has no document"
+    assert builder.library_builder.doc_manager.get_node_definition("standard_surface", "surfaceshader") is not None, \
+        "standard_surface node definition not found"
+    
+    logger.info("✓ MaterialXBuilder construction test passed")
+    return True
+
+def test_skip_default_inherited_inputs():
+    """Test that skip_default omits inputs inherited from a base nodedef (runs without Blender)."""
+    logger = logging.getLogger('BlenderAddonTest')
+    logger.info("Testing skip_default with inherited nodedef inputs...")
+    
+    exporter = import_exporter_module()
+    builder = exporter.MaterialXBuilder("SkipDefaultTest", logger)
+    node_name = builder.add_surface_shader_node("standard_surface", "surface_skip_default")
+    surface_node = builder.nodes[node_name]
+    create_input = builder.library_builder.node_builder.create_mtlx_input
+    
+    # metalness and coat are inherited from ND_standard_surface_surfaceshader_100
+    for input_name, value in (("metalness", 0.0), ("coat", 0.0), ("opacity", [1.0, 1.0, 1.0])):
+        create_input(surface_node, input_name, value=value, node_type="standard_surface",
+                     category="surfaceshader", skip_default=True)
+        assert surface_node.getInput(input_name) is None, f"Default input '{input_name}' was written"
+    
+    # Non-default values are still written
+    create_input(surface_node, "metalness", value=1.0, node_type="standard_surface",
+                 category="surfaceshader", skip_default=True)
+    assert surface_node.getInput("metalness") is not None, "Non-default input 'metalness' was skipped"
+    
+    logger.info("✓ skip_default inherited input test passed")
+    return True
+
 def validate_materialx_file(file_path: str) -> bool:
     """Validate a MaterialX file."""
     logger = logging.getLogger('BlenderAddonTest')
@@ -525,6 +572,21 @@ def run_comprehensive_test():
         logger.info("🧪 Test 3: Error Conditions")
         results['error_conditions'] = test_error_conditions()
         
+        # Test 3b: MaterialXBuilder construction (no Blender needed)
+        logger.info("🧪 Test 3b: MaterialXBuilder Construction")
+        try:
+            results['builder_construction'] = test_materialx_builder_construction()
+        except Exception as e:
+            logger.error(f"✗ MaterialXBuilder construction test failed: {e}")
+            results['builder_construction'] = False
+        
+        logger.info("🧪 Test 3c: skip_default With Inherited Inputs")
+        try:
+            results['skip_default_inherited'] = test_skip_default_inherited_inputs()
+        except Exception as e:
+            logger.error(f"✗ skip_default inherited input test failed: {e}")
+            results['skip_default_inherited'] = False
+        
         # Test 4: Material Export with Real-World Examples
         logger.info("🧪 Test 4: Material Export with Real-World Examples")
         